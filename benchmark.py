@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Data backend benchmark for the Air Passenger Satisfaction Dashboard.
+This script replicates the serialized dataset to several scales, runs the
+dashboard's preprocessing and aggregations on every data backend, checks
+that all backends return identical frames and reports the speedup over pandas.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--scales', default='1,10,100', help='Comma-separated dataset multipliers')
+    parser.add_argument('--backends', default='pandas,polars', help='Comma-separated backends; the first one is the reference')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed runs per backend and scale (the fastest is reported)')
+    return parser.parse_args()
+
+
+def run_pipeline(backend, raw_data):
+    """
+    Run the dashboard's preprocessing and aggregations on a backend.
+
+    Args:
+        backend: DataBackend instance
+        raw_data: Raw pandas frame with numeric codes
+
+    Returns:
+        tuple: (timings in seconds per stage, dict of aggregate frames)
+    """
+    from src.config.constants import RATING_COLUMNS
+
+    timings = {}
+    start = time.perf_counter()
+    data = backend.from_pandas(raw_data)
+    timings['convert'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    processed_data = backend.preprocess(data)
+    timings['preprocess'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = {
+        'by_class_and_age': backend.aggregate_satisfaction_by_class_and_age(data),
+        'by_class': backend.aggregate_satisfaction_by_class(processed_data),
+        'by_customer_type': backend.aggregate_satisfaction_by_customer_type(processed_data),
+        'by_gender': backend.aggregate_satisfaction_by_gender(processed_data),
+        'by_travel_type': backend.aggregate_satisfaction_by_travel_type(processed_data)
+    }
+    for column in RATING_COLUMNS:
+        results[f"ratings {column}"] = backend.aggregate_ratings_by_category(processed_data, column)
+    timings['aggregate'] = time.perf_counter() - start
+
+    timings['total'] = sum(timings.values())
+    return timings, results
+
+
+def main():
+    """Benchmark every backend at every scale."""
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).parent))
+
+    import pandas as pd
+    from pandas.testing import assert_frame_equal
+    from src.utils.backend_utils import get_data_backend
+    from src.utils.data_utils import load_airline_data
+
+    backends = [get_data_backend(name) for name in args.backends.split(',')]
+    data = load_airline_data()
+
+    for scale in [int(scale) for scale in args.scales.split(',')]:
+        raw_data = pd.concat([data] * scale, ignore_index=True)
+        print(f"\n📊 {scale}x scale: {len(raw_data):,} rows")
+
+        reference = None
+        for backend in backends:
+            runs = [run_pipeline(backend, raw_data) for _ in range(args.repeats)]
+            timings = min((run[0] for run in runs), key=lambda run: run['total'])
+            results = runs[-1][1]
+
+            if reference is None:
+                reference = (backend.name, timings, results)
+            else:
+                for name, frame in results.items():
+                    assert_frame_equal(frame, reference[2][name], obj=f"{backend.name} {name}")
+
+            speedup = reference[1]['total'] / timings['total']
+            print(
+                f"  {backend.name:<8} convert {timings['convert']:7.3f}s   preprocess {timings['preprocess']:7.3f}s   "
+                f"aggregate {timings['aggregate']:7.3f}s   total {timings['total']:7.3f}s   {speedup:5.1f}x vs {reference[0]}"
+            )
+        print(f"  ✅ {len(reference[2])} aggregates identical across backends")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Offline build script for the similar passengers index.
+This script standardizes the model features, builds the tree and coarse
+cluster index, and persists it for memory-mapping by the API.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+def parse_args():
+    """Parse command line arguments."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from src.config.constants import NEIGHBOR_INDEX_CONFIG, NEIGHBOR_INDEX_PATH
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--algorithm', choices=['kd_tree', 'ball_tree'], default=NEIGHBOR_INDEX_CONFIG['algorithm'], help='Tree type for exact queries')
+    parser.add_argument('--leaf-size', type=int, default=NEIGHBOR_INDEX_CONFIG['leaf_size'], help='Leaf size of the tree')
+    parser.add_argument('--n-lists', type=int, default=NEIGHBOR_INDEX_CONFIG['n_lists'], help='Coarse clusters for approximate queries (default: derived from the row count)')
+    parser.add_argument('--output', default=NEIGHBOR_INDEX_PATH, help='Path of the persisted index')
+    return parser.parse_args()
+
+
+def main():
+    """Build and persist the index."""
+    args = parse_args()
+
+    from src.utils.data_utils import get_model_features, load_airline_data
+    from src.utils.neighbor_utils import build_neighbor_index, save_neighbor_index
+
+    start = time.perf_counter()
+    features, target = get_model_features(load_airline_data())
+    index = build_neighbor_index(
+        features,
+        target,
+        algorithm=args.algorithm,
+        leaf_size=args.leaf_size,
+        n_lists=args.n_lists
+    )
+    save_neighbor_index(index, args.output)
+
+    print(f"✅ Indexed {len(target)} passengers in {time.perf_counter() - start:.1f}s")
+    print(f"💾 Index saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Shard build script for out-of-core aggregation.
+This script splits raw airline CSV exports (or the serialized dataset) into
+row shards of per-column .npy files and computes the dashboard summaries in
+one pass over them in a process pool. Point AIRLINE_SHARD_DIR at the output
+to serve the dashboard from the shards.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+def parse_args():
+    """Parse command line arguments."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from src.config.constants import AGGREGATION_CONFIG
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('output', help='Destination shard directory')
+    parser.add_argument('csv', nargs='*', help='Raw CSV exports (default: the serialized dataset)')
+    parser.add_argument('--rows-per-shard', type=int, default=AGGREGATION_CONFIG['rows_per_shard'], help='Rows per shard')
+    return parser.parse_args()
+
+
+def main():
+    """Write the shards."""
+    args = parse_args()
+
+    from src.utils.data_utils import load_airline_data
+    from src.utils.shard_utils import build_dashboard_summaries, iter_csv_chunks, iter_frame_chunks, write_shards
+
+    start = time.perf_counter()
+    if args.csv:
+        chunks = iter_csv_chunks(args.csv, args.rows_per_shard)
+    else:
+        chunks = iter_frame_chunks(load_airline_data(), args.rows_per_shard)
+    manifest = write_shards(chunks, args.output)
+
+    rows = sum(shard['rows'] for shard in manifest['shards'])
+    print(f"✅ Wrote {rows} rows in {len(manifest['shards'])} shards in {time.perf_counter() - start:.1f}s")
+    print(f"💾 Shards saved to {args.output}")
+
+    start = time.perf_counter()
+    path = build_dashboard_summaries(args.output)
+    print(f"✅ Summarized the shards in {time.perf_counter() - start:.1f}s")
+    print(f"💾 Summaries saved to {path}")
+    print(f"\nStart the app with AIRLINE_SHARD_DIR={args.output} to serve from the shards")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Load-testing harness for the Air Passenger Satisfaction Dashboard.
+This script starts `gunicorn src.index:server` locally, replays realistic
+browser sessions against it and reports throughput, latency percentiles and
+error rates per request type, optionally sweeping worker counts and classes.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).parent
+
+CLASSIFICATION_OUTPUTS = ['my-graph', 'my-graph-sat', 'my-graph-sat-custype', 'my-graph-sat-gender', 'my-graph-sat-tot']
+RATING_OUTPUTS = [
+    'my-graph-sat-Seat-comfort-pie', 'my-graph-sat-Inflight', 'my-graph-sat-Inflight-entertainment',
+    'my-graph-sat-Online-support', 'my-graph-sat-Ease-of-Online-booking', 'my-graph-sat-Online-boarding',
+    'my-graph-sat-Leg-room-service', 'my-graph-sat-Cleanliness', 'my-graph-sat-Food-and-drink'
+]
+ASSETS = ['/assets/association.css', '/assets/icon.png']
+CLASS_VALUES = [1, 2, 3]
+
+# A throughput gain below this fraction marks the saturation point of a sweep
+SATURATION_GAIN = 0.10
+
+
+def callback_body(outputs, inputs):
+    """
+    Build a `/_dash-update-component` request body as sent by the Dash renderer.
+
+    Args:
+        outputs: List of (component id, property) output pairs
+        inputs: List of (component id, property, value) input triples
+
+    Returns:
+        dict: JSON request body
+    """
+    output_specs = [{'id': component, 'property': prop} for component, prop in outputs]
+    if len(outputs) == 1:
+        output = f"{outputs[0][0]}.{outputs[0][1]}"
+        output_specs = output_specs[0]
+    else:
+        output = '..' + '...'.join(f"{component}.{prop}" for component, prop in outputs) + '..'
+    return {
+        'output': output,
+        'outputs': output_specs,
+        'inputs': [{'id': component, 'property': prop, 'value': value} for component, prop, value in inputs],
+        'changedPropIds': [f"{component}.{prop}" for component, prop, _ in inputs],
+        'state': []
+    }
+
+
+def page_load_steps(pathname):
+    """Requests a browser issues when opening a dashboard page."""
+    return [
+        (f"GET {pathname}", 'GET', pathname, None),
+        ('GET /_dash-layout', 'GET', '/_dash-layout', None),
+        ('GET /_dash-dependencies', 'GET', '/_dash-dependencies', None),
+        ('callback display_page', 'POST', '/_dash-update-component',
+         callback_body([('page-content', 'children')], [('url', 'pathname', pathname)])),
+    ] + [(f"GET {asset}", 'GET', asset, None) for asset in ASSETS]
+
+
+def classification_session(rng):
+    """Open /classification and change the class dropdown a few times."""
+    steps = page_load_steps('/classification')
+    for _ in range(rng.randint(1, 4)):
+        steps.append(('callback genre-choice', 'POST', '/_dash-update-component', callback_body(
+            [(output, 'figure') for output in CLASSIFICATION_OUTPUTS],
+            [('genre-choice', 'value', rng.choice(CLASS_VALUES))]
+        )))
+    return steps
+
+
+def ratings_session(rng):
+    """Open /pie_chart, which renders every rating chart once."""
+    return page_load_steps('/pie_chart') + [
+        ('callback update_rating_charts', 'POST', '/_dash-update-component', callback_body(
+            [(output, 'figure') for output in RATING_OUTPUTS],
+            [('my-graph-sat-Seat-comfort-pie', 'hover-data', None)]
+        ))
+    ]
+
+
+SESSIONS = [classification_session, ratings_session]
+
+
+class Recorder:
+    """Thread-safe collection of (label, latency, ok) samples."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, label, latency, ok):
+        with self._lock:
+            self.samples[label].append(latency)
+            if not ok:
+                self.errors[label] += 1
+
+
+def run_session(host, port, steps, recorder, scheduled_start=None, think_time=0.0):
+    """
+    Replay one session over a single keep-alive connection.
+
+    In open-loop mode the first request is timed from its scheduled start so
+    queueing delay in the harness is not hidden (no coordinated omission).
+    """
+    connection = http.client.HTTPConnection(host, port, timeout=60)
+    try:
+        for position, (label, method, path, body) in enumerate(steps):
+            start = scheduled_start if position == 0 and scheduled_start is not None else time.perf_counter()
+            ok = False
+            try:
+                payload = json.dumps(body).encode() if body is not None else None
+                headers = {'Content-Type': 'application/json'} if body is not None else {}
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                ok = response.status < 400
+            except (OSError, http.client.HTTPException):
+                connection.close()
+            recorder.record(label, time.perf_counter() - start, ok)
+            if think_time:
+                time.sleep(think_time)
+    finally:
+        connection.close()
+
+
+def run_closed_loop(host, port, concurrency, duration, think_time, seed):
+    """Each of `concurrency` virtual users replays sessions back to back."""
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+
+    def user(index):
+        rng = random.Random(seed + index)
+        while time.perf_counter() < deadline:
+            run_session(host, port, rng.choice(SESSIONS)(rng), recorder, think_time=think_time)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(user, range(concurrency)))
+    return recorder
+
+
+def run_open_loop(host, port, rate, concurrency, duration, think_time, seed):
+    """Start sessions as a Poisson process at `rate` sessions/s, independent of response times."""
+    recorder = Recorder()
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        scheduled = start
+        while scheduled < start + duration:
+            scheduled += rng.expovariate(rate)
+            time.sleep(max(0.0, scheduled - time.perf_counter()))
+            executor.submit(run_session, host, port, rng.choice(SESSIONS)(rng), recorder, scheduled, think_time)
+    return recorder
+
+
+def summarize(recorder, elapsed):
+    """
+    Compute per-label and overall statistics.
+
+    Returns:
+        dict: label -> requests, throughput (req/s), error rate and p50/p95/p99 in ms
+    """
+    report = {}
+    all_latencies = []
+    for label in sorted(recorder.samples):
+        latencies = np.array(recorder.samples[label])
+        all_latencies.append(latencies)
+        report[label] = _statistics(latencies, recorder.errors[label], elapsed)
+    if all_latencies:
+        report['TOTAL'] = _statistics(np.concatenate(all_latencies), sum(recorder.errors.values()), elapsed)
+    return report
+
+
+def _statistics(latencies, errors, elapsed):
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    return {
+        'requests': int(len(latencies)),
+        'throughput': len(latencies) / elapsed,
+        'error_rate': errors / len(latencies),
+        'p50_ms': float(p50),
+        'p95_ms': float(p95),
+        'p99_ms': float(p99)
+    }
+
+
+def print_report(title, report):
+    """Print a per-label statistics table."""
+    print(f"\n{title}")
+    print(f"{'request':<40}{'count':>8}{'req/s':>9}{'err%':>7}{'p50ms':>9}{'p95ms':>9}{'p99ms':>9}")
+    for label, stats in report.items():
+        print(
+            f"{label:<40}{stats['requests']:>8}{stats['throughput']:>9.1f}{stats['error_rate'] * 100:>7.2f}"
+            f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}"
+        )
+
+
+def free_port():
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers, worker_class, port, timeout):
+    """
+    Start gunicorn in the project root and wait until it answers.
+
+    Returns:
+        subprocess.Popen: The running gunicorn process
+    """
+    command = [
+        sys.executable, '-m', 'gunicorn', 'src.index:server',
+        '--workers', str(workers),
+        '--worker-class', worker_class,
+        '--bind', f"127.0.0.1:{port}",
+        '--timeout', '120',
+        '--log-level', 'warning'
+    ]
+    if worker_class == 'gthread':
+        command += ['--threads', '4']
+    process = subprocess.Popen(command, cwd=BASE_DIR, start_new_session=True)
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with code {process.returncode}")
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+        try:
+            connection.request('GET', '/_dash-layout')
+            if connection.getresponse().status == 200:
+                return process
+        except OSError:
+            pass
+        finally:
+            connection.close()
+        time.sleep(0.5)
+    stop_server(process)
+    raise RuntimeError(f"gunicorn did not answer within {timeout}s")
+
+
+def stop_server(process):
+    """Stop a gunicorn process group."""
+    if process.poll() is None:
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+
+
+def parse_list(value, cast=str):
+    """Parse a comma-separated command line list."""
+    return [cast(item) for item in value.split(',') if item]
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', default='2', help='Comma-separated gunicorn worker counts to sweep')
+    parser.add_argument('--worker-class', default='sync', help='Comma-separated gunicorn worker classes to sweep (e.g. sync,gthread)')
+    parser.add_argument('--concurrency', default='8', help='Comma-separated concurrency levels to sweep (virtual users / max in-flight sessions)')
+    parser.add_argument('--mode', choices=['closed', 'open'], default='closed', help='Closed loop (users wait for responses) or open loop (Poisson arrivals)')
+    parser.add_argument('--rate', type=float, default=5.0, help='Open loop: session arrivals per second')
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds per measurement')
+    parser.add_argument('--warmup', type=float, default=5.0, help='Unmeasured seconds before each configuration')
+    parser.add_argument('--think-time', type=float, default=0.0, help='Seconds between requests of a session')
+    parser.add_argument('--startup-timeout', type=float, default=120.0, help='Seconds to wait for gunicorn to start')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for session generation')
+    parser.add_argument('--json', help='Write all reports to this JSON file')
+    return parser.parse_args()
+
+
+def main():
+    """Run the configured sweep and report the results."""
+    args = parse_args()
+    concurrency_levels = parse_list(args.concurrency, int)
+    results = []
+
+    for worker_class in parse_list(args.worker_class):
+        for workers in parse_list(args.workers, int):
+            port = free_port()
+            print(f"\n🚀 Starting gunicorn: {workers} x {worker_class} on port {port}")
+            process = start_server(workers, worker_class, port, args.startup_timeout)
+            try:
+                for concurrency in concurrency_levels:
+                    def measure(duration):
+                        start = time.perf_counter()
+                        if args.mode == 'closed':
+                            recorder = run_closed_loop('127.0.0.1', port, concurrency, duration, args.think_time, args.seed)
+                        else:
+                            recorder = run_open_loop('127.0.0.1', port, args.rate, concurrency, duration, args.think_time, args.seed)
+                        return summarize(recorder, time.perf_counter() - start)
+
+                    if args.warmup:
+                        measure(args.warmup)
+                    report = measure(args.duration)
+                    print_report(f"{workers} x {worker_class}, {args.mode} loop, concurrency {concurrency}", report)
+                    results.append({
+                        'workers': workers,
+                        'worker_class': worker_class,
+                        'concurrency': concurrency,
+                        'mode': args.mode,
+                        'report': report
+                    })
+            finally:
+                stop_server(process)
+
+    print("\n" + "=" * 50)
+    print("Sweep summary (TOTAL)")
+    print("=" * 50)
+    print(f"{'workers':>8}{'class':>10}{'conc':>6}{'req/s':>9}{'err%':>7}{'p99ms':>9}")
+    for result in results:
+        total = result['report'].get('TOTAL')
+        if total:
+            print(
+                f"{result['workers']:>8}{result['worker_class']:>10}{result['concurrency']:>6}"
+                f"{total['throughput']:>9.1f}{total['error_rate'] * 100:>7.2f}{total['p99_ms']:>9.1f}"
+            )
+
+    # Saturation: first step of each sweep where more workers or concurrency adds < SATURATION_GAIN throughput
+    for key, label in (('concurrency', 'concurrency'), ('workers', 'worker count')):
+        groups = defaultdict(list)
+        for result in results:
+            if 'TOTAL' not in result['report']:
+                continue
+            if key == 'concurrency':
+                group = f"{result['workers']} x {result['worker_class']}"
+            else:
+                group = f"{result['worker_class']} at concurrency {result['concurrency']}"
+            groups[group].append((result[key], result['report']['TOTAL']['throughput']))
+        for group, points in groups.items():
+            points.sort()
+            for (previous, previous_throughput), (_, throughput) in zip(points, points[1:]):
+                if throughput < previous_throughput * (1 + SATURATION_GAIN):
+                    print(f"📈 Saturation for {group}: throughput flattens at {label} {previous} ({previous_throughput:.1f} req/s)")
+                    break
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f"\n💾 Results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
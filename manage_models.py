@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Model registry management script for the Air Passenger Satisfaction Dashboard.
+This script publishes notebook artifacts (.sav/.pkl) as memory-mappable
+registry versions and promotes the version served by the running app.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+
+def parse_args():
+    """Parse command line arguments."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from src.config.constants import MODEL_FILE_PATH, MODEL_REGISTRY_DIR
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--registry', default=MODEL_REGISTRY_DIR, help='Registry directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    register = commands.add_parser('register', help='Publish a model artifact as a new version')
+    register.add_argument('path', nargs='?', default=MODEL_FILE_PATH, help='joblib or pickle model artifact')
+    register.add_argument('--promote', action='store_true', help='Promote the new version immediately')
+
+    promote = commands.add_parser('promote', help='Promote an existing version')
+    promote.add_argument('version', help='Version name, e.g. v0002')
+
+    commands.add_parser('list', help='List published versions')
+    return parser.parse_args()
+
+
+def main():
+    """Run the requested registry command."""
+    args = parse_args()
+
+    import joblib
+    from src.utils.data_utils import compute_file_hash
+    from src.utils.model_registry import get_current_version, list_versions, promote_version, save_model_version
+
+    if args.command == 'register':
+        version = save_model_version(
+            joblib.load(args.path),
+            args.registry,
+            metadata={'source': str(Path(args.path).resolve()), 'source_sha256': compute_file_hash(args.path)}
+        )
+        print(f"✅ Published {args.path} as {version}")
+        if args.promote:
+            promote_version(version, args.registry)
+            print(f"🚀 Promoted {version}")
+    elif args.command == 'promote':
+        promote_version(args.version, args.registry)
+        print(f"🚀 Promoted {args.version}")
+    else:
+        current = get_current_version(args.registry)
+        for version in list_versions(args.registry):
+            print(f"{'*' if version == current else ' '} {version}")
+
+
+if __name__ == "__main__":
+    main()
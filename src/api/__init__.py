@@ -0,0 +1 @@
+"""HTTP API package for the Air Passenger Satisfaction application."""
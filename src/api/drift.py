@@ -0,0 +1,100 @@
+"""
+Drift monitoring API module for the Air Passenger Satisfaction application.
+Accepts incoming survey batches and exposes per-feature drift as metrics.
+"""
+import io
+
+import pandas as pd
+from flask import Response, jsonify, request
+
+from src.app import server
+from src.utils.drift_utils import drift_monitor_session, encode_survey_batch
+from src.config.constants import MODEL_FEATURE_COLUMNS
+
+
+def read_survey_batch() -> pd.DataFrame:
+    """
+    Read the batch rows from the request body.
+
+    Accepts a CSV body (text/csv, raw export layout) or a JSON object with a
+    'rows' list of records.
+
+    Returns:
+        pd.DataFrame: Batch rows with numeric codes
+
+    Raises:
+        ValueError: If the body is malformed or misses feature columns
+    """
+    if request.mimetype == 'text/csv':
+        batch = pd.read_csv(io.BytesIO(request.get_data()))
+    else:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get('rows'), list):
+            raise ValueError("Request must be text/csv or a JSON object with a 'rows' list")
+        batch = pd.DataFrame.from_records(payload['rows'])
+
+    missing = [column for column in MODEL_FEATURE_COLUMNS if column not in batch]
+    if missing:
+        raise ValueError(f"Batch is missing features: {', '.join(missing)}")
+    if batch.empty:
+        raise ValueError("Batch contains no rows")
+    return encode_survey_batch(batch)
+
+
+@server.route('/api/drift/batch', methods=['POST'])
+def ingest_drift_batch():
+    """
+    Check an incoming survey batch for drift against the training reference.
+
+    Returns:
+        flask.Response: JSON with the per-feature statistics of the batch and of all batches so far
+    """
+    try:
+        batch = read_survey_batch()
+        with drift_monitor_session(write=True) as monitor:
+            statistics = monitor.update(batch)
+            batches = monitor.batches
+    except (ValueError, pd.errors.ParserError) as error:
+        return jsonify({'error': str(error)}), 400
+    except FileNotFoundError as error:
+        return jsonify({'error': str(error)}), 503
+
+    return jsonify({'batches': batches, 'features': statistics.to_dict(orient='records')})
+
+
+@server.route('/metrics', methods=['GET'])
+def drift_metrics():
+    """
+    Expose drift statistics in the Prometheus text format.
+
+    Returns:
+        flask.Response: Plain-text metrics
+    """
+    try:
+        with drift_monitor_session() as monitor:
+            statistics = monitor.statistics()
+            batches, rows = monitor.batches, monitor.rows
+    except FileNotFoundError as error:
+        return Response(f"# {error}\n", status=503, mimetype='text/plain; version=0.0.4')
+
+    lines = [
+        '# HELP airline_drift_batches_total Survey batches checked for drift.',
+        '# TYPE airline_drift_batches_total counter',
+        f"airline_drift_batches_total {batches}",
+        '# HELP airline_drift_rows_total Survey rows checked for drift.',
+        '# TYPE airline_drift_rows_total counter',
+        f"airline_drift_rows_total {rows}"
+    ]
+    for statistic in ('psi', 'ks'):
+        lines += [
+            f"# HELP airline_drift_{statistic} Per-feature {statistic.upper()} against the training reference.",
+            f"# TYPE airline_drift_{statistic} gauge"
+        ]
+        for record in statistics.to_dict(orient='records'):
+            for window in ('batch', 'cumulative'):
+                lines.append(
+                    f'airline_drift_{statistic}{{feature="{record["feature"]}",window="{window}"}} '
+                    f"{record[f'{window}_{statistic}']}"
+                )
+
+    return Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
@@ -0,0 +1,214 @@
+"""
+Filtered export API module for the Air Passenger Satisfaction application.
+Streams the passenger rows behind the dashboard charts as CSV or Parquet.
+"""
+import itertools
+import zlib
+from typing import Dict, Iterable, Iterator, List
+
+import pandas as pd
+from flask import Response, jsonify, request, stream_with_context
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional
+    pa = pq = None
+
+from src.app import server
+from src.utils.data_utils import get_airline_data, preprocess_airline_data
+from src.utils.shard_utils import iter_frame_chunks, iter_shard_chunks
+from src.config.constants import (
+    AGGREGATION_CONFIG,
+    CLASS_MAPPINGS,
+    CUSTOMER_TYPE_MAPPINGS,
+    EXPORT_CONFIG,
+    GENDER_MAPPINGS,
+    TRAVEL_TYPE_MAPPINGS
+)
+
+# Query parameter -> (raw data column, code-to-label mapping)
+EXPORT_FILTERS = {
+    'class': ('Class', CLASS_MAPPINGS),
+    'gender': ('Gender', GENDER_MAPPINGS),
+    'customer_type': ('Customer Type', CUSTOMER_TYPE_MAPPINGS),
+    'travel_type': ('Type of Travel', TRAVEL_TYPE_MAPPINGS)
+}
+
+MIMETYPES = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet'
+}
+
+# Rows are read from the memory-mapped shard columns in shard mode, otherwise from the
+# raw frame the pages already loaded; they are labelled chunk by chunk while streaming.
+shard_dir = AGGREGATION_CONFIG['shard_dir']
+
+
+class _ChunkSink:
+    """Write-only file object that collects Parquet output until it is drained."""
+
+    def __init__(self):
+        self.closed = False
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def parse_filters(args) -> Dict[str, List[int]]:
+    """
+    Translate label filters from the query string into raw column codes.
+
+    Each filter accepts one or more labels from the constants mappings,
+    repeated (?class=eco&class=eco_plus) or comma separated (?class=eco,eco_plus).
+
+    Args:
+        args: Request query arguments
+
+    Returns:
+        Dict[str, List[int]]: Raw column name to accepted codes
+
+    Raises:
+        ValueError: If a label is not part of the filter's mapping
+    """
+    filters = {}
+    for parameter, (column, mappings) in EXPORT_FILTERS.items():
+        labels = [label.strip() for value in args.getlist(parameter) for label in value.split(',') if label.strip()]
+        if not labels:
+            continue
+        codes_by_label = {label: code for code, label in mappings.items()}
+        unknown = [label for label in labels if label not in codes_by_label]
+        if unknown:
+            raise ValueError(
+                f"Unknown {parameter} value(s): {', '.join(unknown)}. "
+                f"Expected one of: {', '.join(codes_by_label)}"
+            )
+        filters[column] = [codes_by_label[label] for label in labels]
+    return filters
+
+
+def iter_source_windows(chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Iterate the raw rows in fixed-size windows, from the shards in shard mode.
+
+    Args:
+        chunk_rows: Source rows per window
+
+    Returns:
+        Iterator[pd.DataFrame]: Raw-coded row windows
+    """
+    if shard_dir:
+        return iter_shard_chunks(shard_dir, chunk_rows)
+    return iter_frame_chunks(get_airline_data(), chunk_rows)
+
+
+def iter_filtered_chunks(windows: Iterable[pd.DataFrame], filters: Dict[str, List[int]]) -> Iterator[pd.DataFrame]:
+    """
+    Yield labelled matching rows one window of source rows at a time.
+
+    Args:
+        windows: Raw-coded row windows
+        filters: Raw column name to accepted codes
+
+    Yields:
+        pd.DataFrame: Labelled matching rows of one window (windows without matches are skipped)
+    """
+    for window in windows:
+        for column, codes in filters.items():
+            window = window[window[column].isin(codes)]
+        if len(window):
+            yield preprocess_airline_data(window)
+
+
+def iter_csv(windows: Iterable[pd.DataFrame], filters: Dict[str, List[int]]) -> Iterator[bytes]:
+    """Serialize the filtered rows as CSV, writing the header once."""
+    windows = iter(windows)
+    first = next(windows, None)
+    if first is None:
+        return
+    yield preprocess_airline_data(first.iloc[:0]).to_csv(index=False).encode()
+    for chunk in iter_filtered_chunks(itertools.chain([first], windows), filters):
+        yield chunk.to_csv(index=False, header=False).encode()
+
+
+def iter_parquet(windows: Iterable[pd.DataFrame], filters: Dict[str, List[int]]) -> Iterator[bytes]:
+    """Serialize the filtered rows as Parquet, one row group per chunk."""
+    windows = iter(windows)
+    first = next(windows, None)
+    if first is None:
+        return
+    schema = pa.Schema.from_pandas(preprocess_airline_data(first.iloc[:1]), preserve_index=False)
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for chunk in iter_filtered_chunks(itertools.chain([first], windows), filters):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def gzip_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Gzip a byte stream on the fly."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@server.route('/api/export', methods=['GET'])
+def export_passengers():
+    """
+    Stream the passengers matching the dashboard filters.
+
+    Query parameters:
+        class, gender, customer_type, travel_type: Labels from the constants mappings
+        format: 'csv' (default) or 'parquet'
+        gzip: 'true' to gzip the stream on the fly
+
+    Returns:
+        flask.Response: Streaming attachment, serialized chunk by chunk
+    """
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_CONFIG['formats']:
+        return jsonify({'error': f"format must be one of: {', '.join(EXPORT_CONFIG['formats'])}"}), 400
+    if export_format == 'parquet' and pq is None:
+        return jsonify({'error': 'Parquet export requires pyarrow to be installed'}), 501
+    try:
+        filters = parse_filters(request.args)
+    except ValueError as error:
+        return jsonify({'error': str(error)}), 400
+
+    serializer = iter_csv if export_format == 'csv' else iter_parquet
+    chunks = serializer(iter_source_windows(EXPORT_CONFIG['chunk_rows']), filters)
+    filename = f"passengers.{export_format}"
+    mimetype = MIMETYPES[export_format]
+    if request.args.get('gzip', '').lower() in ('1', 'true', 'yes'):
+        chunks = gzip_stream(chunks)
+        filename += '.gz'
+        mimetype = 'application/gzip'
+
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
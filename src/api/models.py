@@ -0,0 +1,93 @@
+"""
+Model serving API module for the Air Passenger Satisfaction application.
+Serves predictions from the model registry and exposes an admin trigger that
+promotes a new version without restarting the workers.
+"""
+import hmac
+import os
+
+from flask import jsonify, request
+
+from src.app import server
+from src.utils.data_utils import parse_profiles
+from src.utils.model_registry import ModelRegistry, list_versions, promote_version
+from src.config.constants import MODEL_REGISTRY_CONFIG, SATISFACTION_MAPPINGS
+
+# One registry per worker; the model arrays themselves are shared memory maps
+registry = ModelRegistry()
+
+
+def is_admin_request() -> bool:
+    """Check the X-Admin-Token header against the configured admin token."""
+    token = os.environ.get(MODEL_REGISTRY_CONFIG['admin_token_env'])
+    if not token:
+        return False
+    return hmac.compare_digest(request.headers.get('X-Admin-Token', ''), token)
+
+
+@server.route('/api/predict', methods=['POST'])
+def predict_satisfaction():
+    """
+    Predict satisfaction with the promoted model version.
+
+    Request body:
+        profile / profiles: Feature values keyed by MODEL_FEATURE_COLUMNS name
+
+    Returns:
+        flask.Response: JSON with the serving version and one prediction per profile
+    """
+    version, model = registry.get()
+    if model is None:
+        return jsonify({'error': 'No model version has been promoted'}), 503
+
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    try:
+        profiles = parse_profiles(payload, MODEL_REGISTRY_CONFIG['max_batch'])
+    except ValueError as error:
+        return jsonify({'error': str(error)}), 400
+
+    predictions = model.predict(profiles)
+    return jsonify({
+        'version': version,
+        'predictions': [SATISFACTION_MAPPINGS[int(prediction)] for prediction in predictions]
+    })
+
+
+@server.route('/api/models', methods=['GET'])
+def list_model_versions():
+    """
+    List the registry versions and the one served by this worker.
+
+    Returns:
+        flask.Response: JSON with the served version and every published version
+    """
+    version, _ = registry.get()
+    return jsonify({'current': version, 'versions': list_versions(registry.registry_dir)})
+
+
+@server.route('/api/admin/models/promote', methods=['POST'])
+def promote_model_version():
+    """
+    Promote a published version; every worker swaps to it on its next poll.
+
+    Request body:
+        version: Version name to promote
+
+    Returns:
+        flask.Response: JSON with the version now served by this worker
+    """
+    if not is_admin_request():
+        return jsonify({'error': 'Forbidden'}), 403
+
+    payload = request.get_json(silent=True)
+    version = payload.get('version') if isinstance(payload, dict) else None
+    if not version:
+        return jsonify({'error': "Request must contain a 'version'"}), 400
+    try:
+        promote_version(version, registry.registry_dir)
+    except FileNotFoundError as error:
+        return jsonify({'error': str(error)}), 404
+
+    return jsonify({'current': registry.refresh()})
@@ -0,0 +1,75 @@
+"""
+Similar passengers API module for the Air Passenger Satisfaction application.
+Exposes the persisted neighbor index as a JSON endpoint on the Flask server.
+"""
+from flask import jsonify, request
+
+from src.app import server
+from src.utils.data_utils import parse_profiles
+from src.utils.neighbor_utils import get_neighbor_features, load_neighbor_index, query_neighbors
+from src.config.constants import (
+    MODEL_FEATURE_COLUMNS,
+    NEIGHBOR_INDEX_CONFIG,
+    SATISFACTION_MAPPINGS
+)
+
+# Memory-map the index once at startup; workers share it through the page cache
+try:
+    neighbor_index = load_neighbor_index()
+except FileNotFoundError:
+    neighbor_index = None
+
+
+@server.route('/api/similar-passengers', methods=['POST'])
+def similar_passengers():
+    """
+    Return the k most similar passengers and their satisfaction for each profile.
+
+    Request body:
+        profile / profiles: Feature values keyed by MODEL_FEATURE_COLUMNS name
+        k: Number of neighbors (default NEIGHBOR_INDEX_CONFIG['default_k'])
+        approximate: Scan the nearest coarse clusters instead of the exact tree
+
+    Returns:
+        flask.Response: JSON with one neighbor list per profile
+    """
+    if neighbor_index is None:
+        return jsonify({'error': 'Neighbor index has not been built'}), 503
+
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    try:
+        profiles = parse_profiles(payload, NEIGHBOR_INDEX_CONFIG['max_batch'])
+        k = int(payload.get('k', NEIGHBOR_INDEX_CONFIG['default_k']))
+    except (TypeError, ValueError) as error:
+        return jsonify({'error': str(error)}), 400
+    approximate = payload.get('approximate', False)
+    if not isinstance(approximate, bool):
+        return jsonify({'error': "approximate must be true or false"}), 400
+    if not 1 <= k <= NEIGHBOR_INDEX_CONFIG['max_k']:
+        return jsonify({'error': f"k must be between 1 and {NEIGHBOR_INDEX_CONFIG['max_k']}"}), 400
+
+    distances, rows = query_neighbors(
+        neighbor_index,
+        profiles,
+        k=k,
+        approximate=approximate
+    )
+
+    results = []
+    for profile_distances, profile_rows in zip(distances, rows):
+        found = profile_rows >= 0
+        profile_rows = profile_rows[found]
+        features = get_neighbor_features(neighbor_index, profile_rows)
+        results.append([
+            {
+                'row': int(row),
+                'distance': float(distance),
+                'satisfaction': SATISFACTION_MAPPINGS[int(neighbor_index['target'][row])],
+                'features': dict(zip(MODEL_FEATURE_COLUMNS, values.tolist()))
+            }
+            for row, distance, values in zip(profile_rows, profile_distances[found], features)
+        ])
+
+    return jsonify({'results': results})
@@ -9,7 +9,11 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # File paths
 DATA_FILE_PATH = os.path.join(BASE_DIR, 'models', 'Invistico_Airline_initial.sav')
+MODEL_FILE_PATH = os.path.join(BASE_DIR, 'models', 'Invistico_Airline_Classification_DecisionTree.sav')
+NEIGHBOR_INDEX_PATH = os.path.join(BASE_DIR, 'models', 'neighbor_index.joblib')
+MODEL_REGISTRY_DIR = os.path.join(BASE_DIR, 'models', 'registry')
 ASSETS_DIR = os.path.join(BASE_DIR, 'assets')
+CACHE_DIR = os.path.join(BASE_DIR, 'cache')
 
 # Class mappings
 CLASS_MAPPINGS = {
@@ -49,6 +53,143 @@ COL_CUSTOMER_TYPE = 2
 COL_TRAVEL_TYPE = 4
 COL_CLASS = 5
 
+# Feature layout used to train the notebook models (delay columns are dropped)
+MODEL_TARGET_COLUMN = 'satisfaction'
+MODEL_FEATURE_COLUMNS = [
+    'Gender',
+    'Customer Type',
+    'Age',
+    'Type of Travel',
+    'Class',
+    'Flight Distance',
+    'Seat comfort',
+    'Departure/Arrival time convenient',
+    'Food and drink',
+    'Gate location',
+    'Inflight wifi service',
+    'Inflight entertainment',
+    'Online support',
+    'Ease of Online booking',
+    'On-board service',
+    'Leg room service',
+    'Baggage handling',
+    'Checkin service',
+    'Cleanliness',
+    'Online boarding'
+]
+
+# Permutation importance configuration
+IMPORTANCE_CONFIG = {
+    'n_repeats': 10,
+    'n_jobs': None,  # None uses every available core
+    'random_state': 0
+}
+
+# Hyperparameter search space per model family (expanded as a full grid)
+SEARCH_SPACE = {
+    'decision_tree': {
+        'criterion': ['gini', 'entropy'],
+        'max_depth': [5, 10, 15, 21, 30, None],
+        'min_samples_leaf': [1, 5, 20]
+    },
+    'knn': {
+        'n_neighbors': [1, 3, 5, 7, 9, 15],
+        'weights': ['uniform', 'distance']
+    },
+    'svm': {
+        'C': [0.1, 1.0, 10.0],
+        'gamma': ['scale', 0.01, 0.1]
+    }
+}
+
+# Successive halving / hyperband configuration
+SEARCH_CONFIG = {
+    'eta': 3,  # Keep the best 1/eta configurations per rung
+    'min_resources': 2000,  # Rows used by the first rung
+    'cv': 3,
+    'n_jobs': None,  # None uses every available core
+    'random_state': 0,
+    'output_path': os.path.join(BASE_DIR, 'models', 'Invistico_Airline_Classification_Best.sav'),
+    'leaderboard_path': os.path.join(BASE_DIR, 'models', 'search_leaderboard.csv')
+}
+
+# Similar passengers index configuration
+NEIGHBOR_INDEX_CONFIG = {
+    'algorithm': 'kd_tree',  # 'kd_tree' or 'ball_tree'
+    'leaf_size': 40,
+    'n_lists': None,  # Coarse clusters for approximate queries; None derives lists_per_sqrt_rows * sqrt(rows)
+    'lists_per_sqrt_rows': 4,
+    'n_probe': 8,  # Clusters scanned per approximate query
+    'training_sample': 100000,  # Minimum rows used to fit the coarse clusters (raised to 39 rows per cluster)
+    'default_k': 5,
+    'max_k': 100,
+    'max_batch': 1000
+}
+
+# Filtered export configuration
+EXPORT_CONFIG = {
+    'chunk_rows': 50000,  # Source rows filtered and serialized per streamed chunk
+    'formats': ['csv', 'parquet']
+}
+
+# Continuous columns summarized with quantile sketches
+DISTRIBUTION_COLUMNS = [
+    'Flight Distance',
+    'Departure Delay in Minutes',
+    'Arrival Delay in Minutes',
+    'Age'
+]
+
+# t-digest compression (larger is more accurate and keeps more centroids)
+SKETCH_COMPRESSION = 200
+
+# Percentiles drawn on the distributions page
+DISTRIBUTION_PERCENTILES = [1, 5, 10, 25, 50, 75, 90, 95, 99]
+
+# Model registry configuration
+MODEL_REGISTRY_CONFIG = {
+    'poll_interval': 2.0,  # Seconds between checks for a newly promoted version
+    'admin_token_env': 'MODEL_ADMIN_TOKEN',  # Admin endpoints are disabled when unset
+    'max_batch': 1000  # Profiles per prediction request
+}
+
+# Sharded aggregation configuration
+# Set AIRLINE_SHARD_DIR to aggregate from row shards instead of the in-memory dataset
+AGGREGATION_CONFIG = {
+    'shard_dir': os.environ.get('AIRLINE_SHARD_DIR'),
+    'rows_per_shard': 1000000,
+    'n_jobs': None  # None uses every available core
+}
+
+# Data processing backend for loading, preprocessing and aggregation:
+# 'pandas' (default) or 'polars' (multithreaded and Arrow-native; requires the optional polars package)
+DATA_BACKEND = os.environ.get('AIRLINE_DATA_BACKEND', 'pandas')
+
+# Notebook encodings of the labels found in the raw CSV exports
+CSV_ENCODINGS = {
+    'satisfaction': {'satisfied': 1, 'dissatisfied': 0},
+    'Gender': {'Male': 1, 'Female': 2},
+    'Customer Type': {'Loyal Customer': 0, 'disloyal Customer': 1},
+    'Type of Travel': {'Business travel': 1, 'Personal Travel': 2},
+    'Class': {'Business': 1, 'Eco': 2, 'Eco Plus': 3}
+}
+
+# Distribution drift monitoring configuration
+DRIFT_CONFIG = {
+    'max_bins': 20,  # Features with more distinct values get quantile bins
+    'psi_warning': 0.1,
+    'psi_alert': 0.25,
+    'refresh_interval_ms': 30000,
+    'state_path': os.path.join(CACHE_DIR, 'drift_state.json')
+}
+
+# Warm-up self-check settings (see warmup.py)
+WARMUP_CONFIG = {
+    'latency_budget_ms': 2000,  # Maximum warm latency of any page callback
+    'cold_budget_ms': 3000,  # Maximum latency of the first call, as paid by the first user
+    'repeats': 3  # Warm runs per check; the slowest one is compared with the budget
+}
+
 # Dropdown options
 CLASS_DROPDOWN_OPTIONS = [
     {'label': 'Business', 'value': 1},
@@ -10,7 +10,8 @@ from dash.dependencies import Input, Output, State
 import dash_bootstrap_components as dbc
 
 from src.app import server, app
-from src.pages import classification, pie_chart
+from src.pages import classification, pie_chart, importance, distributions, drift
+from src.api import drift as drift_api, export, models, neighbors  # noqa: F401 (registers the API routes on the server)
 from src.config.constants import NAVBAR_CONFIG, APP_CONFIG
 
 
@@ -24,7 +25,10 @@ def create_navbar():
     dropdown = dbc.DropdownMenu(
         children=[
             dbc.DropdownMenuItem("Categorical Visualization", href="/classification"),
-            dbc.DropdownMenuItem("Ratings", href="/pie_chart")
+            dbc.DropdownMenuItem("Ratings", href="/pie_chart"),
+            dbc.DropdownMenuItem("Distributions", href="/distributions"),
+            dbc.DropdownMenuItem("Drivers of Satisfaction", href="/importance"),
+            dbc.DropdownMenuItem("Drift", href="/drift")
         ],
         nav=True,
         in_navbar=True,
@@ -104,6 +108,12 @@ def display_page(pathname):
         return classification.layout
     elif pathname == '/pie_chart':
         return pie_chart.layout
+    elif pathname == '/distributions':
+        return distributions.layout
+    elif pathname == '/importance':
+        return importance.layout
+    elif pathname == '/drift':
+        return drift.layout
     else:
         # Default to classification page
         return classification.layout
@@ -9,27 +9,39 @@ from dash.dependencies import Output, Input
 import plotly.express as px
 
 from src.app import app
-from src.utils.data_utils import (
-    get_processed_airline_data,
-    aggregate_satisfaction_by_class,
-    aggregate_satisfaction_by_customer_type,
-    aggregate_satisfaction_by_gender,
-    aggregate_satisfaction_by_travel_type
+from src.utils.backend_utils import get_data_backend
+from src.utils.shard_utils import (
+    aggregate_satisfaction_by_class_sharded,
+    aggregate_satisfaction_by_class_and_age_sharded,
+    aggregate_satisfaction_by_customer_type_sharded,
+    aggregate_satisfaction_by_gender_sharded,
+    aggregate_satisfaction_by_travel_type_sharded
 )
 from src.config.constants import (
+    AGGREGATION_CONFIG,
     CLASS_DROPDOWN_OPTIONS,
     PLOTLY_THEME,
     CHART_LABELS
 )
 
-# Load and preprocess data once at module level for efficiency
-processed_data, raw_data = get_processed_airline_data()
-
-# Pre-aggregate data for visualizations
-satisfaction_by_class = aggregate_satisfaction_by_class(processed_data)
-satisfaction_by_customer_type = aggregate_satisfaction_by_customer_type(processed_data)
-satisfaction_by_gender = aggregate_satisfaction_by_gender(processed_data)
-satisfaction_by_travel_type = aggregate_satisfaction_by_travel_type(processed_data)
+# Pre-aggregate data for visualizations once at module level for efficiency
+shard_dir = AGGREGATION_CONFIG['shard_dir']
+if shard_dir:
+    # Read the aggregates precomputed from the row shards so the dataset never has to fit in memory
+    satisfaction_by_age = aggregate_satisfaction_by_class_and_age_sharded(shard_dir)
+    satisfaction_by_class = aggregate_satisfaction_by_class_sharded(shard_dir)
+    satisfaction_by_customer_type = aggregate_satisfaction_by_customer_type_sharded(shard_dir)
+    satisfaction_by_gender = aggregate_satisfaction_by_gender_sharded(shard_dir)
+    satisfaction_by_travel_type = aggregate_satisfaction_by_travel_type_sharded(shard_dir)
+else:
+    backend = get_data_backend()
+    raw_data = backend.load()
+    processed_data = backend.preprocess(raw_data)
+    satisfaction_by_age = backend.aggregate_satisfaction_by_class_and_age(raw_data)
+    satisfaction_by_class = backend.aggregate_satisfaction_by_class(processed_data)
+    satisfaction_by_customer_type = backend.aggregate_satisfaction_by_customer_type(processed_data)
+    satisfaction_by_gender = backend.aggregate_satisfaction_by_gender(processed_data)
+    satisfaction_by_travel_type = backend.aggregate_satisfaction_by_travel_type(processed_data)
 
 # Layout configuration
 layout = html.Div([
@@ -172,7 +184,7 @@ def update_classification_graphs(class_value):
     """
     # Age distribution histogram for selected class
     fig_age = px.histogram(
-        data_frame=raw_data[raw_data.Class == class_value],
+        data_frame=satisfaction_by_age[satisfaction_by_age.Class == class_value],
         x='Age',
         y="satisfaction",
         color="Age"
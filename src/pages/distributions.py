@@ -0,0 +1,180 @@
+"""
+Distributions page module for the Air Passenger Satisfaction application.
+Displays box plots and percentiles of the continuous columns, answered from
+per class x satisfaction quantile sketches.
+"""
+import dash_core_components as dcc
+import dash_bootstrap_components as dbc
+import dash_html_components as html
+from dash.dependencies import Output, Input
+import plotly.graph_objects as go
+
+from src.app import app
+from src.utils.data_utils import get_airline_data
+from src.utils.shard_utils import build_distribution_sketches_sharded
+from src.utils.sketch_utils import build_distribution_sketches, query_distribution, summarize_box
+from src.config.constants import (
+    AGGREGATION_CONFIG,
+    CLASS_DROPDOWN_OPTIONS,
+    CLASS_MAPPINGS,
+    DISTRIBUTION_COLUMNS,
+    DISTRIBUTION_PERCENTILES,
+    PLOTLY_THEME,
+    SATISFACTION_MAPPINGS
+)
+
+# Build the sketches once at module level from the shared raw frame
+shard_dir = AGGREGATION_CONFIG['shard_dir']
+if shard_dir:
+    # Read the merged digests precomputed with the other pages' aggregates from the row shards
+    sketches = build_distribution_sketches_sharded(shard_dir)
+else:
+    sketches = build_distribution_sketches(get_airline_data())
+
+SATISFACTION_DROPDOWN_OPTIONS = [
+    {'label': label.capitalize(), 'value': code}
+    for code, label in SATISFACTION_MAPPINGS.items()
+]
+
+
+# Layout configuration
+layout = html.Div([
+    dbc.Container([
+        # Main title
+        dbc.Row([
+            dbc.Col(
+                html.H1(children='Airline Passenger Satisfaction Prediction'),
+                className="mb-2"
+            )
+        ], className="main-topic"),
+
+        # Subtitle
+        dbc.Row([
+            dbc.Col(
+                html.H6(children='Analysis & Passenger Satisfaction Prediction on US Airline'),
+                className="mb-2"
+            )
+        ], className="main-topic"),
+
+        # Section header
+        dbc.Row([
+            dbc.Col(
+                dbc.Card([
+                    html.H4(
+                        children="Distance, Delay and Age Distributions",
+                        className="text-center text-nav"
+                    )
+                ], body=True, className="card-col-main-row"),
+                className="mt-2 mb-1"
+            )
+        ], className="main-row"),
+
+        # Filters
+        dbc.Row([
+            dbc.Col(
+                dcc.Dropdown(
+                    id='distribution-column',
+                    options=[{'label': column, 'value': column} for column in DISTRIBUTION_COLUMNS],
+                    value=DISTRIBUTION_COLUMNS[0],
+                    clearable=False
+                ),
+                className="drop-down"
+            ),
+            dbc.Col(
+                dcc.Dropdown(
+                    id='distribution-class',
+                    options=CLASS_DROPDOWN_OPTIONS,
+                    value=[option['value'] for option in CLASS_DROPDOWN_OPTIONS],
+                    multi=True
+                ),
+                className="drop-down"
+            ),
+            dbc.Col(
+                dcc.Dropdown(
+                    id='distribution-satisfaction',
+                    options=SATISFACTION_DROPDOWN_OPTIONS,
+                    value=[option['value'] for option in SATISFACTION_DROPDOWN_OPTIONS],
+                    multi=True
+                ),
+                className="drop-down"
+            )
+        ], className="main-row"),
+
+        # Box plot
+        dbc.Row([
+            dbc.Col(dcc.Graph(id='my-graph-distribution-box'))
+        ], className="f-card"),
+
+        # Section: Percentiles
+        dbc.Row([
+            dbc.Col(
+                dbc.Card([
+                    html.H4(children="Percentiles", className="text-center text-nav")
+                ], body=True, className="card-col-main-row"),
+                className="mt-2 mb-1"
+            )
+        ], className="main-row"),
+
+        dbc.Row([
+            dbc.Col(dcc.Graph(id='my-graph-distribution-percentiles'))
+        ], className="f-card")
+    ], className="container-out")
+])
+
+
+@app.callback([
+    Output('my-graph-distribution-box', 'figure'),
+    Output('my-graph-distribution-percentiles', 'figure')],
+    [Input('distribution-column', 'value'),
+     Input('distribution-class', 'value'),
+     Input('distribution-satisfaction', 'value')]
+)
+def update_distribution_charts(column, class_values, satisfaction_values):
+    """
+    Update the box plot and percentile chart for the selected filters.
+
+    Args:
+        column: Selected continuous column
+        class_values: Selected class codes
+        satisfaction_values: Selected satisfaction codes
+
+    Returns:
+        tuple: Box plot figure and percentile line chart figure
+    """
+    fig_box = go.Figure()
+    fig_percentiles = go.Figure()
+    percentiles = [percentile / 100 for percentile in DISTRIBUTION_PERCENTILES]
+
+    for satisfaction_code in satisfaction_values or []:
+        satisfaction_label = SATISFACTION_MAPPINGS[satisfaction_code]
+
+        # One box per selected class
+        boxes = [
+            summarize_box(query_distribution(sketches, column, [class_code], [satisfaction_code]))
+            for class_code in class_values or []
+        ]
+        fig_box.add_trace(go.Box(
+            name=satisfaction_label,
+            x=[CLASS_MAPPINGS[class_code] for class_code in class_values or []],
+            q1=[box['q1'] for box in boxes],
+            median=[box['median'] for box in boxes],
+            q3=[box['q3'] for box in boxes],
+            lowerfence=[box['lowerfence'] for box in boxes],
+            upperfence=[box['upperfence'] for box in boxes]
+        ))
+
+        # Percentiles across every selected class
+        digest = query_distribution(sketches, column, class_values or [], [satisfaction_code])
+        fig_percentiles.add_trace(go.Scatter(
+            name=satisfaction_label,
+            x=DISTRIBUTION_PERCENTILES,
+            y=digest.quantile(percentiles),
+            mode='lines+markers'
+        ))
+
+    fig_box.update_layout(boxmode='group', xaxis_title='Class', yaxis_title=column)
+    fig_box.layout.template = PLOTLY_THEME
+    fig_percentiles.update_layout(xaxis_title='Percentile', yaxis_title=column)
+    fig_percentiles.layout.template = PLOTLY_THEME
+
+    return fig_box, fig_percentiles
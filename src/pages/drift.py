@@ -0,0 +1,142 @@
+"""
+Drift monitoring page module for the Air Passenger Satisfaction application.
+Displays per-feature PSI and KS statistics of incoming survey batches against
+the training data.
+"""
+import dash_core_components as dcc
+import dash_bootstrap_components as dbc
+import dash_html_components as html
+from dash.dependencies import Output, Input
+import plotly.express as px
+
+from src.app import app
+from src.utils.drift_utils import drift_monitor_session
+from src.config.constants import DRIFT_CONFIG, PLOTLY_THEME
+
+WINDOW_LABELS = {
+    'batch': 'Latest batch',
+    'cumulative': 'All batches'
+}
+
+
+# Layout configuration
+layout = html.Div([
+    dbc.Container([
+        # Main title
+        dbc.Row([
+            dbc.Col(
+                html.H1(children='Airline Passenger Satisfaction Prediction'),
+                className="mb-2"
+            )
+        ], className="main-topic"),
+
+        # Subtitle
+        dbc.Row([
+            dbc.Col(
+                html.H6(children='Analysis & Passenger Satisfaction Prediction on US Airline'),
+                className="mb-2"
+            )
+        ], className="main-topic"),
+
+        # Section: PSI
+        dbc.Row([
+            dbc.Col(
+                dbc.Card([
+                    html.H4(
+                        children="Population Stability Index of each feature against the training data",
+                        className="text-center text-nav"
+                    ),
+                    html.H6(id='drift-summary', className="text-center")
+                ], body=True, className="card-col-main-row"),
+                className="mt-2 mb-1"
+            )
+        ], className="main-row"),
+
+        dbc.Row([
+            dbc.Col(dcc.Graph(id='my-graph-drift-psi'))
+        ], className="f-card"),
+
+        # Section: KS
+        dbc.Row([
+            dbc.Col(
+                dbc.Card([
+                    html.H4(
+                        children="Kolmogorov-Smirnov distance of each feature against the training data",
+                        className="text-center text-nav"
+                    )
+                ], body=True, className="card-col-main-row"),
+                className="mt-2 mb-1"
+            )
+        ], className="main-row"),
+
+        dbc.Row([
+            dbc.Col(dcc.Graph(id='my-graph-drift-ks'))
+        ], className="f-card"),
+
+        dcc.Interval(id='drift-interval', interval=DRIFT_CONFIG['refresh_interval_ms'])
+    ], className="container-out")
+])
+
+
+def create_drift_chart(statistics, statistic):
+    """
+    Create a grouped bar chart of one drift statistic per feature.
+
+    Args:
+        statistics: Frame returned by DriftMonitor.statistics()
+        statistic: 'psi' or 'ks'
+
+    Returns:
+        plotly.graph_objs.Figure: Bar chart with the latest batch and all batches side by side
+    """
+    data = statistics.melt(
+        id_vars='feature',
+        value_vars=[f"{window}_{statistic}" for window in WINDOW_LABELS],
+        var_name='window',
+        value_name=statistic
+    )
+    data['window'] = data['window'].str.replace(f"_{statistic}", '', regex=False).map(WINDOW_LABELS)
+
+    fig = px.bar(
+        data_frame=data,
+        x='feature',
+        y=statistic,
+        color='window',
+        barmode='group',
+        labels={'feature': 'Feature', statistic: statistic.upper(), 'window': 'Window'}
+    )
+    if statistic == 'psi':
+        fig.add_hline(y=DRIFT_CONFIG['psi_warning'], line_dash='dash', line_color='orange')
+        fig.add_hline(y=DRIFT_CONFIG['psi_alert'], line_dash='dash', line_color='red')
+    fig.layout.template = PLOTLY_THEME
+    return fig
+
+
+@app.callback([
+    Output('drift-summary', 'children'),
+    Output('my-graph-drift-psi', 'figure'),
+    Output('my-graph-drift-ks', 'figure')],
+    [Input('drift-interval', 'n_intervals')]
+)
+def update_drift_charts(_):
+    """
+    Update the drift charts from the shared drift state.
+
+    Returns:
+        tuple: Summary text, PSI figure and KS figure
+    """
+    try:
+        with drift_monitor_session() as monitor:
+            statistics = monitor.statistics()
+            batches, rows = monitor.batches, monitor.rows
+    except FileNotFoundError as error:
+        fig = px.bar(title=str(error))
+        fig.layout.template = PLOTLY_THEME
+        return str(error), fig, fig
+
+    alerts = statistics.loc[statistics['batch_psi'] >= DRIFT_CONFIG['psi_alert'], 'feature'].tolist()
+    summary = f"{batches} batches, {rows} rows checked"
+    if alerts:
+        summary += f" | Drifting in the latest batch: {', '.join(alerts)}"
+
+    return summary, create_drift_chart(statistics, 'psi'), create_drift_chart(statistics, 'ks')
@@ -0,0 +1,87 @@
+"""
+Drivers of satisfaction page module for the Air Passenger Satisfaction application.
+Displays the permutation importance of each model feature.
+"""
+import dash_core_components as dcc
+import dash_bootstrap_components as dbc
+import dash_html_components as html
+from dash.dependencies import Output, Input
+import plotly.express as px
+
+from src.app import app
+from src.utils.importance_utils import get_feature_importance
+from src.config.constants import PLOTLY_THEME
+
+
+# Layout configuration
+layout = html.Div([
+    dbc.Container([
+        # Main title
+        dbc.Row([
+            dbc.Col(
+                html.H1(children='Airline Passenger Satisfaction Prediction'),
+                className="mb-2"
+            )
+        ], className="main-topic"),
+
+        # Subtitle
+        dbc.Row([
+            dbc.Col(
+                html.H6(children='Analysis & Passenger Satisfaction Prediction on US Airline'),
+                className="mb-2"
+            )
+        ], className="main-topic"),
+
+        # Section header
+        dbc.Row([
+            dbc.Col(
+                dbc.Card([
+                    html.H4(
+                        children="Drivers of Satisfaction (accuracy drop when a feature is shuffled)",
+                        className="text-center text-nav"
+                    )
+                ], body=True, className="card-col-main-row"),
+                className="mt-2 mb-1"
+            )
+        ], className="main-row"),
+
+        # Importance graph
+        dbc.Row([
+            dbc.Col(dcc.Graph(id='my-graph-importance'))
+        ], className="f-card")
+    ], className="container-out")
+])
+
+
+@app.callback(
+    Output('my-graph-importance', 'figure'),
+    [Input('my-graph-importance', 'hover-data')]
+)
+def update_importance_chart(_):
+    """
+    Update the permutation importance chart.
+
+    Importance is only read from the per-model cache, which is filled
+    offline by warmup.py; a missing cache is reported in the chart title.
+
+    Returns:
+        plotly.graph_objs.Figure: Horizontal bar chart of feature importance
+    """
+    try:
+        importance = get_feature_importance()
+    except FileNotFoundError as error:
+        fig = px.bar(title=str(error))
+        fig.layout.template = PLOTLY_THEME
+        return fig
+
+    fig = px.bar(
+        data_frame=importance.iloc[::-1],
+        x='importance_mean',
+        y='feature',
+        error_x='importance_std',
+        orientation='h',
+        labels={'importance_mean': 'Mean Accuracy Drop', 'feature': 'Feature'},
+        height=700
+    )
+    fig.layout.template = PLOTLY_THEME
+    return fig
@@ -9,18 +9,26 @@ from dash.dependencies import Output, Input
 import plotly.express as px
 
 from src.app import app
-from src.utils.data_utils import get_processed_airline_data, aggregate_ratings_by_category
-from src.config.constants import RATING_COLUMNS, CHART_TITLES, PLOTLY_THEME
+from src.utils.backend_utils import get_data_backend
+from src.utils.shard_utils import aggregate_ratings_by_category_sharded
+from src.config.constants import AGGREGATION_CONFIG, RATING_COLUMNS, CHART_TITLES, PLOTLY_THEME
 
 
-# Load and preprocess data once at module level
-processed_data, _ = get_processed_airline_data()
-
-# Pre-aggregate ratings data for all categories
-ratings_data = {
-    column: aggregate_ratings_by_category(processed_data, column)
-    for column in RATING_COLUMNS
-}
+# Pre-aggregate ratings data for all categories once at module level
+shard_dir = AGGREGATION_CONFIG['shard_dir']
+if shard_dir:
+    # Read the aggregates precomputed from the row shards so the dataset never has to fit in memory
+    ratings_data = {
+        column: aggregate_ratings_by_category_sharded(shard_dir, column)
+        for column in RATING_COLUMNS
+    }
+else:
+    backend = get_data_backend()
+    processed_data = backend.preprocess(backend.load())
+    ratings_data = {
+        column: backend.aggregate_ratings_by_category(processed_data, column)
+        for column in RATING_COLUMNS
+    }
 
 
 # Layout configuration
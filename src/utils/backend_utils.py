@@ -0,0 +1,238 @@
+"""
+Data processing backends for the Air Passenger Satisfaction application.
+This module puts loading, preprocessing and aggregation behind one interface
+so the dashboard can run on pandas or on the multithreaded, Arrow-native
+Polars engine. Both backends return identical pandas frames from every
+aggregate, so pages and charts do not depend on the backend in use.
+
+Select the backend with the AIRLINE_DATA_BACKEND environment variable
+(see DATA_BACKEND in src/config/constants.py).
+"""
+from abc import ABC, abstractmethod
+from typing import List
+
+import pandas as pd
+
+try:
+    import polars as pl
+except ImportError:  # The Polars backend is optional
+    pl = None
+
+from src.utils import data_utils
+from src.config.constants import (
+    DATA_BACKEND,
+    CLASS_MAPPINGS,
+    SATISFACTION_MAPPINGS,
+    GENDER_MAPPINGS,
+    CUSTOMER_TYPE_MAPPINGS,
+    TRAVEL_TYPE_MAPPINGS,
+    COL_SATISFACTION,
+    COL_GENDER,
+    COL_CUSTOMER_TYPE,
+    COL_TRAVEL_TYPE,
+    COL_CLASS
+)
+
+# Code-to-label mappings applied by preprocess_airline_data, keyed by column position
+PREPROCESS_MAPPINGS = {
+    COL_CLASS: CLASS_MAPPINGS,
+    COL_SATISFACTION: SATISFACTION_MAPPINGS,
+    COL_GENDER: GENDER_MAPPINGS,
+    COL_CUSTOMER_TYPE: CUSTOMER_TYPE_MAPPINGS,
+    COL_TRAVEL_TYPE: TRAVEL_TYPE_MAPPINGS
+}
+
+
+class DataBackend(ABC):
+    """
+    Interface of a data processing backend.
+
+    Backends keep data in their native frame type between load, preprocess
+    and aggregate; only the aggregates are returned as pandas frames, equal
+    to what the data_utils function of the same name returns.
+    """
+
+    name = None
+
+    @abstractmethod
+    def load(self):
+        """Load the raw airline data (numeric codes) as a native frame, from the shared per-process copy."""
+
+    @abstractmethod
+    def from_pandas(self, data: pd.DataFrame):
+        """Convert a raw pandas frame to the native frame type."""
+
+    @abstractmethod
+    def preprocess(self, data):
+        """Replace numeric codes with descriptive labels."""
+
+    @abstractmethod
+    def aggregate_satisfaction_by_class(self, data) -> pd.DataFrame:
+        """Satisfaction counts per class (data: preprocessed)."""
+
+    @abstractmethod
+    def aggregate_satisfaction_by_customer_type(self, data) -> pd.DataFrame:
+        """Satisfaction counts per customer type and class (data: preprocessed)."""
+
+    @abstractmethod
+    def aggregate_satisfaction_by_gender(self, data) -> pd.DataFrame:
+        """Satisfaction counts per gender and class (data: preprocessed)."""
+
+    @abstractmethod
+    def aggregate_satisfaction_by_travel_type(self, data) -> pd.DataFrame:
+        """Satisfaction counts per travel type and class (data: preprocessed)."""
+
+    @abstractmethod
+    def aggregate_satisfaction_by_class_and_age(self, data) -> pd.DataFrame:
+        """Satisfied passengers per class code and age (data: raw)."""
+
+    @abstractmethod
+    def aggregate_ratings_by_category(self, data, category: str) -> pd.DataFrame:
+        """Counts per rating of a category (data: preprocessed)."""
+
+
+class PandasBackend(DataBackend):
+    """Reference backend; every method is the data_utils function of the same name (load reads the shared frame)."""
+
+    name = 'pandas'
+
+    def load(self) -> pd.DataFrame:
+        return data_utils.get_airline_data()
+
+    def from_pandas(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+    def preprocess(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data_utils.preprocess_airline_data(data)
+
+    def aggregate_satisfaction_by_class(self, data):
+        return data_utils.aggregate_satisfaction_by_class(data)
+
+    def aggregate_satisfaction_by_customer_type(self, data):
+        return data_utils.aggregate_satisfaction_by_customer_type(data)
+
+    def aggregate_satisfaction_by_gender(self, data):
+        return data_utils.aggregate_satisfaction_by_gender(data)
+
+    def aggregate_satisfaction_by_travel_type(self, data):
+        return data_utils.aggregate_satisfaction_by_travel_type(data)
+
+    def aggregate_satisfaction_by_class_and_age(self, data):
+        return data_utils.aggregate_satisfaction_by_class_and_age(data)
+
+    def aggregate_ratings_by_category(self, data, category):
+        return data_utils.aggregate_ratings_by_category(data, category)
+
+
+class PolarsBackend(DataBackend):
+    """
+    Backend built on Polars.
+
+    Preprocessing only rewrites the five coded columns (the other Arrow
+    buffers are shared, not copied) and group-bys run on all cores. The
+    aggregates use the same keys as data_utils; benchmark.py checks that the
+    frames are equal.
+    """
+
+    name = 'polars'
+
+    def __init__(self):
+        if pl is None:
+            raise ImportError("The polars backend requires polars to be installed (pip install polars)")
+
+    def load(self):
+        return self.from_pandas(data_utils.get_airline_data())
+
+    def from_pandas(self, data: pd.DataFrame):
+        return pl.from_pandas(data)
+
+    def preprocess(self, data):
+        columns = data.columns
+        # Unmapped codes are kept, as text, like the pandas replace keeps them
+        return data.with_columns([
+            pl.col(columns[position]).replace_strict(
+                mapping,
+                default=pl.col(columns[position]).cast(pl.Utf8),
+                return_dtype=pl.Utf8
+            )
+            for position, mapping in PREPROCESS_MAPPINGS.items()
+        ])
+
+    def _group_aggregate(self, data, keys: List[str], value_column: str = 'Online boarding', how: str = 'count') -> pd.DataFrame:
+        """
+        Group by the key columns and aggregate one value column.
+
+        Matches `data.groupby(keys, as_index=False)[[value_column]].agg(how)`:
+        rows with a missing key are dropped, groups are sorted by key, and a
+        key that is also the value column is only returned as the aggregate.
+
+        Args:
+            data: Polars frame
+            keys: Group key columns
+            value_column: Column to aggregate
+            how: 'count' (non-null values) or 'sum'
+
+        Returns:
+            pd.DataFrame: Key columns followed by the aggregated value column
+        """
+        value = pl.col(value_column).count() if how == 'count' else pl.col(value_column).sum()
+        if how == 'count':
+            # Polars counts are UInt32; pandas counts are int64
+            value = value.cast(pl.Int64)
+
+        result = (
+            data.lazy()
+            .filter(pl.all_horizontal(pl.col(keys).is_not_null()))
+            .group_by(keys)
+            .agg(value.alias('_value'))
+            .sort(keys)
+            .collect()
+        )
+
+        # Like pandas, a grouping column that is also aggregated is only returned once, as the aggregate
+        if value_column in keys:
+            result = result.drop(value_column)
+        return result.rename({'_value': value_column}).to_pandas()
+
+    def aggregate_satisfaction_by_class(self, data):
+        return self._group_aggregate(data, ['satisfaction', 'Class'])
+
+    def aggregate_satisfaction_by_customer_type(self, data):
+        return self._group_aggregate(data, ['satisfaction', 'Customer Type', 'Class'])
+
+    def aggregate_satisfaction_by_gender(self, data):
+        return self._group_aggregate(data, ['satisfaction', 'Gender', 'Class'])
+
+    def aggregate_satisfaction_by_travel_type(self, data):
+        return self._group_aggregate(data, ['satisfaction', 'Type of Travel', 'Class'])
+
+    def aggregate_satisfaction_by_class_and_age(self, data):
+        return self._group_aggregate(data, ['Class', 'Age'], 'satisfaction', 'sum')
+
+    def aggregate_ratings_by_category(self, data, category):
+        return self._group_aggregate(data, [category])
+
+
+DATA_BACKENDS = {
+    PandasBackend.name: PandasBackend,
+    PolarsBackend.name: PolarsBackend
+}
+
+
+def get_data_backend(name: str = DATA_BACKEND) -> DataBackend:
+    """
+    Create the configured data processing backend.
+
+    Args:
+        name: Backend name ('pandas' or 'polars')
+
+    Returns:
+        DataBackend: Backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the backend's optional package is not installed
+    """
+    if name not in DATA_BACKENDS:
+        raise ValueError(f"Unknown data backend: {name} (expected one of {', '.join(DATA_BACKENDS)})")
+    return DATA_BACKENDS[name]()
@@ -2,11 +2,17 @@
 Data loading and preprocessing utilities for the Air Passenger Satisfaction application.
 This module provides functions to load and preprocess airline data.
 """
+import hashlib
+import os
 import pickle
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from typing import Tuple
 from src.config.constants import (
     DATA_FILE_PATH,
+    MODEL_FEATURE_COLUMNS,
+    MODEL_TARGET_COLUMN,
     CLASS_MAPPINGS,
     SATISFACTION_MAPPINGS,
     GENDER_MAPPINGS,
@@ -41,6 +47,20 @@ def load_airline_data() -> pd.DataFrame:
         raise Exception(f"Error loading data: {str(e)}")
 
 
+@lru_cache(maxsize=1)
+def get_airline_data() -> pd.DataFrame:
+    """
+    Load the raw airline data once per process and share it.
+    
+    The pages, the data backends and the export API all read this frame, so a
+    worker holds a single copy of the dataset; callers must not modify it.
+    
+    Returns:
+        pd.DataFrame: Raw airline data
+    """
+    return load_airline_data()
+
+
 def preprocess_airline_data(data: pd.DataFrame) -> pd.DataFrame:
     """
     Preprocess airline data by replacing numeric codes with descriptive labels.
@@ -87,6 +107,24 @@ def get_processed_airline_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
     return processed_data, raw_data
 
 
+def get_model_features(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract the feature matrix and target vector in the notebook training layout.
+    
+    Args:
+        data: Raw airline data with numeric codes
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: A tuple containing:
+            - features: Float64 matrix with one column per MODEL_FEATURE_COLUMNS entry
+            - target: Satisfaction codes (0 = dissatisfied, 1 = satisfied)
+    """
+    features = np.ascontiguousarray(data[MODEL_FEATURE_COLUMNS].to_numpy(dtype=np.float64))
+    target = data[MODEL_TARGET_COLUMN].to_numpy()
+    
+    return features, target
+
+
 def aggregate_satisfaction_by_class(data: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate satisfaction counts by class.
@@ -139,6 +177,19 @@ def aggregate_satisfaction_by_travel_type(data: pd.DataFrame) -> pd.DataFrame:
     return data.groupby(['satisfaction', 'Type of Travel', 'Class'], as_index=False)[['Online boarding']].count()
 
 
+def aggregate_satisfaction_by_class_and_age(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sum satisfaction codes (i.e. count satisfied passengers) by class and age.
+    
+    Args:
+        data: Raw airline data with numeric codes
+        
+    Returns:
+        pd.DataFrame: Aggregated data with the satisfied count per class code and age
+    """
+    return data.groupby(['Class', 'Age'], as_index=False)['satisfaction'].sum()
+
+
 def aggregate_ratings_by_category(data: pd.DataFrame, category: str) -> pd.DataFrame:
     """
     Aggregate ratings counts by a specific category.
@@ -151,3 +202,86 @@ def aggregate_ratings_by_category(data: pd.DataFrame, category: str) -> pd.DataF
         pd.DataFrame: Aggregated data with counts per category rating
     """
     return data.groupby([category], as_index=False)[['Online boarding']].count()
+
+
+def compute_file_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 digest of a file.
+    
+    Args:
+        path: Path of the file to hash
+        chunk_size: Number of bytes read per iteration
+        
+    Returns:
+        str: Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _cached_file_hash(path: str, mtime_ns: int, size: int) -> str:
+    """Hash a file once per (path, modification time, size) version."""
+    return compute_file_hash(path)
+
+
+def get_file_hash(path: str) -> str:
+    """
+    Return the SHA-256 digest of a file, hashing it again only when it changes.
+    
+    Request paths can key caches on a file's contents at the cost of a stat
+    call; a replaced file gets a new modification time or size.
+    
+    Args:
+        path: Path of the file to hash
+        
+    Returns:
+        str: Hex digest of the file contents
+    """
+    stat = os.stat(path)
+    return _cached_file_hash(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def parse_profiles(payload: dict, max_profiles: int) -> np.ndarray:
+    """
+    Convert request profiles into a feature matrix in the training layout.
+    
+    Args:
+        payload: Request body with either a 'profile' object or a 'profiles' list,
+            each mapping every MODEL_FEATURE_COLUMNS name to a numeric value
+        max_profiles: Maximum number of profiles per request
+        
+    Returns:
+        np.ndarray: Float64 matrix with one row per profile
+        
+    Raises:
+        ValueError: If the profiles are missing, too many, incomplete or not finite
+    """
+    profiles = payload.get('profiles')
+    if profiles is None:
+        profiles = [payload['profile']] if 'profile' in payload else []
+    if not isinstance(profiles, list) or not profiles:
+        raise ValueError("Request must contain a 'profile' object or a 'profiles' list")
+    if len(profiles) > max_profiles:
+        raise ValueError(f"At most {max_profiles} profiles per request")
+
+    rows = []
+    for profile in profiles:
+        if not isinstance(profile, dict):
+            raise ValueError("Each profile must be an object of feature values")
+        missing = [column for column in MODEL_FEATURE_COLUMNS if column not in profile]
+        if missing:
+            raise ValueError(f"Profile is missing features: {', '.join(missing)}")
+        try:
+            rows.append([float(profile[column]) for column in MODEL_FEATURE_COLUMNS])
+        except (TypeError, ValueError):
+            raise ValueError("Profile feature values must be numeric")
+
+    features = np.array(rows, dtype=np.float64)
+    # float() accepts 'nan' and 'inf', and JSON allows NaN and Infinity; models and trees cannot rank them
+    if not np.isfinite(features).all():
+        raise ValueError("Profile feature values must be finite")
+    return features
@@ -0,0 +1,312 @@
+"""
+Distribution drift utilities for the Air Passenger Satisfaction application.
+This module keeps compact reference histograms of every model feature and
+compares incoming survey batches against them with PSI and KS statistics.
+
+Each batch is binned once against the reference edges and its counts are
+added to running totals, so a check costs O(batch) and never re-reads history.
+"""
+import errno
+import json
+import os
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows development setups lock with msvcrt instead
+    fcntl = None
+    import msvcrt
+
+from src.config.constants import CACHE_DIR, CSV_ENCODINGS, DATA_FILE_PATH, DRIFT_CONFIG, MODEL_FEATURE_COLUMNS
+from src.utils.data_utils import get_file_hash, load_airline_data
+
+# Smoothing for empty bins so PSI stays finite
+EPSILON = 1e-4
+
+# In-process cache of reference histograms keyed by file path
+_reference_cache: Dict[str, Dict[str, Dict[str, List[float]]]] = {}
+
+
+def build_drift_reference(
+    data: pd.DataFrame,
+    features: Sequence[str] = MODEL_FEATURE_COLUMNS,
+    max_bins: int = DRIFT_CONFIG['max_bins']
+) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Build reference histograms from the training data.
+
+    Features with at most max_bins distinct values (codes and 0-5 ratings) get
+    one bin per value; continuous features get quantile bins.
+
+    Args:
+        data: Raw airline data with numeric codes
+        features: Feature columns to monitor
+        max_bins: Maximum number of bins per feature
+
+    Returns:
+        Dict[str, Dict[str, List[float]]]: Per feature, the interior bin edges and reference counts
+    """
+    reference = {}
+    for feature in features:
+        values = data[feature].dropna().to_numpy(dtype=np.float64)
+        distinct = np.unique(values)
+        if len(distinct) <= max_bins:
+            edges = (distinct[:-1] + distinct[1:]) / 2
+        else:
+            edges = np.unique(np.quantile(values, np.linspace(0, 1, max_bins + 1)[1:-1]))
+        counts = np.bincount(np.searchsorted(edges, values, side='right'), minlength=len(edges) + 1)
+        reference[feature] = {'edges': edges.tolist(), 'counts': counts.tolist()}
+    return reference
+
+
+def compute_drift_statistics(reference_counts: np.ndarray, counts: np.ndarray) -> Dict[str, float]:
+    """
+    Compare a histogram against its reference.
+
+    Args:
+        reference_counts: Reference bin counts
+        counts: Observed bin counts on the same bins
+
+    Returns:
+        Dict[str, float]: psi (population stability index) and ks (maximum
+        distance between the binned CDFs)
+    """
+    if counts.sum() == 0:
+        return {'psi': 0.0, 'ks': 0.0}
+    expected = np.maximum(reference_counts / reference_counts.sum(), EPSILON)
+    observed = np.maximum(counts / counts.sum(), EPSILON)
+    psi = float(np.sum((observed - expected) * np.log(observed / expected)))
+    ks = float(np.max(np.abs(np.cumsum(counts) / counts.sum() - np.cumsum(reference_counts) / reference_counts.sum())))
+    return {'psi': psi, 'ks': ks}
+
+
+class DriftMonitor:
+    """
+    Running drift state for a reference.
+
+    Tracks the counts of the latest batch and the cumulative counts of every
+    batch since the monitor was created.
+    """
+
+    def __init__(self, reference: Dict[str, Dict[str, List[float]]], state: Optional[Dict] = None, reference_id: Optional[str] = None):
+        self.reference = reference
+        self.reference_id = reference_id
+        self.features = list(reference)
+        self._edges = [np.asarray(reference[feature]['edges']) for feature in self.features]
+        self._reference_counts = np.concatenate([reference[feature]['counts'] for feature in self.features]).astype(np.float64)
+        sizes = [len(edges) + 1 for edges in self._edges]
+        self._offsets = np.concatenate([[0], np.cumsum(sizes)])
+
+        total_bins = int(self._offsets[-1])
+        if state is None or state.get('reference') != reference_id or len(state.get('cumulative_counts', [])) != total_bins:
+            # No saved totals, or totals saved against a different reference
+            state = {}
+        self.cumulative_counts = np.asarray(state.get('cumulative_counts', np.zeros(total_bins)), dtype=np.float64)
+        self.batch_counts = np.asarray(state.get('batch_counts', np.zeros(total_bins)), dtype=np.float64)
+        self.batches = int(state.get('batches', 0))
+        self.rows = int(state.get('rows', 0))
+
+    def update(self, batch: pd.DataFrame) -> pd.DataFrame:
+        """
+        Bin a batch against the reference and fold it into the running totals.
+
+        Args:
+            batch: Incoming rows with every monitored feature column
+
+        Returns:
+            pd.DataFrame: Per-feature drift statistics (see statistics())
+        """
+        values = batch[self.features].to_numpy(dtype=np.float64)
+        bins = np.empty(values.shape, dtype=np.int64)
+        for position, edges in enumerate(self._edges):
+            bins[:, position] = np.searchsorted(edges, values[:, position], side='right') + self._offsets[position]
+
+        # Missing values are not counted
+        valid = ~np.isnan(values)
+        counts = np.bincount(bins[valid], minlength=int(self._offsets[-1])).astype(np.float64)
+
+        self.batch_counts = counts
+        self.cumulative_counts = self.cumulative_counts + counts
+        self.batches += 1
+        self.rows += len(batch)
+        return self.statistics()
+
+    def statistics(self) -> pd.DataFrame:
+        """
+        Compute per-feature drift statistics for the latest batch and all batches so far.
+
+        Returns:
+            pd.DataFrame: One row per feature with batch_psi, batch_ks, cumulative_psi and cumulative_ks
+        """
+        records = []
+        for position, feature in enumerate(self.features):
+            window = slice(self._offsets[position], self._offsets[position + 1])
+            batch = compute_drift_statistics(self._reference_counts[window], self.batch_counts[window])
+            cumulative = compute_drift_statistics(self._reference_counts[window], self.cumulative_counts[window])
+            records.append({
+                'feature': feature,
+                'batch_psi': batch['psi'],
+                'batch_ks': batch['ks'],
+                'cumulative_psi': cumulative['psi'],
+                'cumulative_ks': cumulative['ks']
+            })
+        return pd.DataFrame(records)
+
+    def to_state(self) -> Dict:
+        """Return the running totals as a JSON-serializable dict."""
+        return {
+            'reference': self.reference_id,
+            'cumulative_counts': self.cumulative_counts.tolist(),
+            'batch_counts': self.batch_counts.tolist(),
+            'batches': self.batches,
+            'rows': self.rows
+        }
+
+
+def encode_survey_batch(batch: pd.DataFrame) -> pd.DataFrame:
+    """
+    Encode categorical labels of raw CSV exports with the notebook codes.
+
+    Columns that are already numeric are left unchanged.
+
+    Args:
+        batch: Incoming rows
+
+    Returns:
+        pd.DataFrame: Rows with numeric codes
+    """
+    batch = batch.copy()
+    for column, encoding in CSV_ENCODINGS.items():
+        if column in batch and batch[column].dtype == object:
+            batch[column] = batch[column].map(encoding)
+    return batch
+
+
+def get_drift_reference_path(data_path: str = DATA_FILE_PATH) -> str:
+    """
+    Return the reference file of the training data, keyed by the SHA-256 of the data file.
+
+    A retrained dataset therefore gets a new reference instead of being
+    compared against the old one. The digest is memoized per file version.
+
+    Raises:
+        FileNotFoundError: If the data file is not found
+    """
+    if not os.path.exists(data_path):
+        raise FileNotFoundError(f"Data file not found at: {data_path}")
+    return os.path.join(CACHE_DIR, f"drift_reference_{get_file_hash(data_path)}.json")
+
+
+def save_drift_reference() -> str:
+    """
+    Build the reference histograms from the training data and save them.
+
+    This is an offline step (run by warmup.py); the reference is left
+    untouched when it already matches the current training data.
+
+    Returns:
+        str: Path of the reference file
+
+    Raises:
+        FileNotFoundError: If the data file is not found
+    """
+    path = get_drift_reference_path()
+    if not os.path.exists(path):
+        _write_json(path, build_drift_reference(load_airline_data()))
+    return path
+
+
+def get_drift_reference(path: str) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Load the saved reference histograms, once per process and reference file.
+
+    Args:
+        path: Reference file (see get_drift_reference_path)
+
+    Returns:
+        Dict[str, Dict[str, List[float]]]: Reference histograms
+
+    Raises:
+        FileNotFoundError: If the reference has not been built
+    """
+    if path not in _reference_cache:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Drift reference not found at: {path} (run python warmup.py)")
+        with open(path) as file:
+            _reference_cache[path] = json.load(file)
+    return _reference_cache[path]
+
+
+def _lock_file(file, exclusive: bool) -> None:
+    """Block until the lock file is locked (msvcrt only offers exclusive locks)."""
+    if fcntl is not None:
+        fcntl.flock(file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return
+
+    file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError as error:
+            # LK_LOCK gives up after about 10 seconds; keep waiting like flock does
+            if error.errno != errno.EDEADLK:
+                raise
+
+
+def _unlock_file(file) -> None:
+    """Release a lock taken with _lock_file."""
+    if fcntl is not None:
+        fcntl.flock(file, fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def drift_monitor_session(path: str = DRIFT_CONFIG['state_path'], write: bool = False):
+    """
+    Open the shared drift state under a file lock.
+
+    Gunicorn workers each receive a share of the batches, so the running
+    totals live in a file; the lock serializes concurrent updates.
+
+    Args:
+        path: State file
+        write: Save the state back when the block exits
+
+    Yields:
+        DriftMonitor: Monitor restored from the saved state
+
+    Raises:
+        FileNotFoundError: If the drift reference has not been built
+    """
+    reference_path = get_drift_reference_path()
+    reference = get_drift_reference(reference_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.lock", 'w') as lock:
+        _lock_file(lock, exclusive=write)
+        try:
+            state = None
+            if os.path.exists(path):
+                with open(path) as file:
+                    state = json.load(file)
+            monitor = DriftMonitor(reference, state, reference_id=os.path.basename(reference_path))
+            yield monitor
+            if write:
+                _write_json(path, monitor.to_state())
+        finally:
+            _unlock_file(lock)
+
+
+def _write_json(path: str, payload) -> None:
+    """Write JSON atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as file:
+        json.dump(payload, file)
+    os.replace(temp_path, path)
@@ -0,0 +1,254 @@
+"""
+Permutation feature importance utilities for the Air Passenger Satisfaction application.
+This module measures how much the trained model relies on each feature by
+shuffling one feature at a time and recording the drop in accuracy.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.config.constants import (
+    CACHE_DIR,
+    IMPORTANCE_CONFIG,
+    MODEL_FEATURE_COLUMNS,
+    MODEL_FILE_PATH
+)
+from src.utils.data_utils import get_file_hash, get_model_features, load_airline_data
+from src.utils.parallel_utils import (
+    attach_shared_array,
+    release_shared_array,
+    resolve_worker_count,
+    share_array
+)
+
+# Per-process state populated by the pool initializer
+_worker_state = {}
+
+# In-process cache of importance frames keyed by cache file path
+_importance_cache: Dict[str, pd.DataFrame] = {}
+
+
+def load_model(model_path: str = MODEL_FILE_PATH):
+    """
+    Load a model artifact saved by the notebook with joblib.
+
+    Args:
+        model_path: Path of the model artifact
+
+    Returns:
+        Fitted scikit-learn estimator
+
+    Raises:
+        FileNotFoundError: If the model file is not found
+    """
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Model file not found at: {model_path}")
+    return joblib.load(model_path)
+
+
+def _init_importance_worker(model, features_spec, target_spec) -> None:
+    """Attach a worker process to the shared feature matrix and target vector."""
+    features_block, features = attach_shared_array(features_spec)
+    target_block, target = attach_shared_array(target_spec)
+    _worker_state.update(
+        model=model,
+        features=features,
+        target=target,
+        blocks=(features_block, target_block),
+        scratch=None
+    )
+
+
+def _score_feature_permutations(feature_index: int, seeds: Sequence[int]) -> Tuple[int, List[float]]:
+    """
+    Score the model with one feature column shuffled, once per seed.
+
+    Each worker keeps a single private scratch copy of the feature matrix and
+    only rewrites the permuted column, restoring it before returning.
+    """
+    features = _worker_state['features']
+    target = _worker_state['target']
+    model = _worker_state['model']
+
+    if _worker_state['scratch'] is None:
+        _worker_state['scratch'] = features.copy()
+    scratch = _worker_state['scratch']
+
+    column = features[:, feature_index]
+    scores = []
+    for seed in seeds:
+        permutation = np.random.default_rng(seed).permutation(column.shape[0])
+        scratch[:, feature_index] = column[permutation]
+        scores.append(float(model.score(scratch, target)))
+    scratch[:, feature_index] = column
+
+    return feature_index, scores
+
+
+def compute_permutation_importance(
+    model,
+    features: np.ndarray,
+    target: np.ndarray,
+    feature_names: Sequence[str] = MODEL_FEATURE_COLUMNS,
+    n_repeats: int = IMPORTANCE_CONFIG['n_repeats'],
+    n_jobs: Optional[int] = IMPORTANCE_CONFIG['n_jobs'],
+    random_state: int = IMPORTANCE_CONFIG['random_state']
+) -> pd.DataFrame:
+    """
+    Compute permutation importance with the permutations sharded across a process pool.
+
+    The feature matrix and target are placed in shared memory once; workers
+    attach to them instead of receiving a pickled copy with every task.
+
+    Args:
+        model: Fitted estimator exposing score(X, y)
+        features: Feature matrix in the training layout
+        target: Target vector
+        feature_names: Names of the feature matrix columns
+        n_repeats: Number of shuffles per feature
+        n_jobs: Number of worker processes; None uses every available core
+        random_state: Seed from which the per-shuffle seeds are derived
+
+    Returns:
+        pd.DataFrame: One row per feature with importance_mean and importance_std,
+        sorted by decreasing importance
+    """
+    baseline = float(model.score(features, target))
+    seeds = np.random.SeedSequence(random_state).generate_state(len(feature_names) * n_repeats)
+    seeds = seeds.reshape(len(feature_names), n_repeats)
+    workers = resolve_worker_count(n_jobs)
+
+    # Split each feature's repeats into chunks so the pool stays busy when
+    # there are fewer features than workers
+    chunks_per_feature = max(1, min(n_repeats, -(-workers // len(feature_names))))
+
+    features_block, features_spec = share_array(features)
+    target_block, target_spec = share_array(target)
+    scores = {index: [] for index in range(len(feature_names))}
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_importance_worker,
+            initargs=(model, features_spec, target_spec)
+        ) as executor:
+            futures = [
+                executor.submit(_score_feature_permutations, index, chunk.tolist())
+                for index in range(len(feature_names))
+                for chunk in np.array_split(seeds[index], chunks_per_feature)
+            ]
+            for future in futures:
+                index, chunk_scores = future.result()
+                scores[index].extend(chunk_scores)
+    finally:
+        release_shared_array(features_block)
+        release_shared_array(target_block)
+
+    drops = np.array([baseline - np.array(scores[index]) for index in range(len(feature_names))])
+    importance = pd.DataFrame({
+        'feature': list(feature_names),
+        'importance_mean': drops.mean(axis=1),
+        'importance_std': drops.std(axis=1)
+    })
+    return importance.sort_values('importance_mean', ascending=False, ignore_index=True)
+
+
+def get_importance_cache_path(
+    model_path: str = MODEL_FILE_PATH,
+    n_repeats: int = IMPORTANCE_CONFIG['n_repeats'],
+    random_state: int = IMPORTANCE_CONFIG['random_state']
+) -> str:
+    """
+    Return the cache file of a model artifact, keyed by the SHA-256 of the file.
+
+    The digest is memoized per file version, so callbacks only stat the artifact.
+
+    Raises:
+        FileNotFoundError: If the model file is not found
+    """
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Model file not found at: {model_path}")
+    return os.path.join(CACHE_DIR, f"importance_{get_file_hash(model_path)}_{n_repeats}_{random_state}.json")
+
+
+def build_feature_importance(
+    model_path: str = MODEL_FILE_PATH,
+    n_repeats: int = IMPORTANCE_CONFIG['n_repeats'],
+    n_jobs: Optional[int] = IMPORTANCE_CONFIG['n_jobs'],
+    random_state: int = IMPORTANCE_CONFIG['random_state']
+) -> str:
+    """
+    Compute permutation importance for a model artifact and write it to the cache.
+
+    This is an offline step (run by warmup.py); the cache is left untouched
+    when it already holds the result for this artifact.
+
+    Args:
+        model_path: Path of the model artifact
+        n_repeats: Number of shuffles per feature
+        n_jobs: Number of worker processes; None uses every available core
+        random_state: Seed from which the per-shuffle seeds are derived
+
+    Returns:
+        str: Path of the cache file
+
+    Raises:
+        FileNotFoundError: If the model file is not found
+    """
+    cache_path = get_importance_cache_path(model_path, n_repeats, random_state)
+    if os.path.exists(cache_path):
+        return cache_path
+
+    features, target = get_model_features(load_airline_data())
+    importance = compute_permutation_importance(
+        load_model(model_path),
+        features,
+        target,
+        n_repeats=n_repeats,
+        n_jobs=n_jobs,
+        random_state=random_state
+    )
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as file:
+        json.dump(importance.to_dict(orient='records'), file)
+    os.replace(temp_path, cache_path)
+    return cache_path
+
+
+def get_feature_importance(
+    model_path: str = MODEL_FILE_PATH,
+    n_repeats: int = IMPORTANCE_CONFIG['n_repeats'],
+    random_state: int = IMPORTANCE_CONFIG['random_state']
+) -> pd.DataFrame:
+    """
+    Read the cached permutation importance of a model artifact.
+
+    Nothing is computed here, so serving workers never start a process pool;
+    the cache is filled by build_feature_importance (run by warmup.py).
+
+    Args:
+        model_path: Path of the model artifact
+        n_repeats: Number of shuffles per feature
+        random_state: Seed from which the per-shuffle seeds are derived
+
+    Returns:
+        pd.DataFrame: Importance frame as returned by compute_permutation_importance
+
+    Raises:
+        FileNotFoundError: If the model file or its importance cache is not found
+    """
+    cache_path = get_importance_cache_path(model_path, n_repeats, random_state)
+    if cache_path in _importance_cache:
+        return _importance_cache[cache_path]
+
+    if not os.path.exists(cache_path):
+        raise FileNotFoundError(f"Importance cache not found at: {cache_path} (run python warmup.py)")
+    importance = pd.read_json(cache_path, orient='records')
+
+    _importance_cache[cache_path] = importance
+    return importance
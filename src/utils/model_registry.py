@@ -0,0 +1,253 @@
+"""
+Versioned model registry for the Air Passenger Satisfaction application.
+This module stores model artifacts in a memory-mappable layout so every
+worker shares one physical copy, and hot-swaps the served version when a new
+one is promoted without interrupting requests already in flight.
+
+Registry layout:
+    registry/
+        CURRENT              name of the promoted version
+        v0001/manifest.json  artifact format and metadata
+        v0001/*.npy          decision tree arrays, or
+        v0001/model.joblib   any other estimator (uncompressed joblib)
+"""
+import json
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import joblib
+import numpy as np
+from sklearn.tree import DecisionTreeClassifier
+
+from src.config.constants import MODEL_REGISTRY_CONFIG, MODEL_REGISTRY_DIR
+
+CURRENT_FILE = 'CURRENT'
+MANIFEST_FILE = 'manifest.json'
+TREE_ARRAYS = ['children_left', 'children_right', 'feature', 'threshold', 'value']
+
+
+class MmapTreeClassifier:
+    """
+    Decision tree classifier that predicts directly from memory-mapped node arrays.
+
+    scikit-learn copies a tree's nodes into private memory when it is unpickled,
+    so this class walks the exported arrays instead, level by level for the
+    whole batch at once.
+    """
+
+    def __init__(self, children_left, children_right, feature, threshold, value, classes):
+        self.children_left = children_left
+        self.children_right = children_right
+        self.feature = feature
+        self.threshold = threshold
+        self.value = value
+        self.classes_ = np.asarray(classes)
+
+    def apply(self, features: np.ndarray) -> np.ndarray:
+        """Return the leaf index reached by each row."""
+        # Match scikit-learn, which compares float32 features against float64 thresholds
+        features = np.asarray(features, dtype=np.float32)
+        rows = np.arange(len(features))
+        nodes = np.zeros(len(features), dtype=np.int64)
+        active = self.children_left[nodes] != -1
+        while active.any():
+            current = nodes[active]
+            go_left = features[rows[active], self.feature[current]] <= self.threshold[current]
+            nodes[active] = np.where(go_left, self.children_left[current], self.children_right[current])
+            active = self.children_left[nodes] != -1
+        return nodes
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """Return class probabilities for each row."""
+        counts = np.asarray(self.value[self.apply(features)][:, 0, :], dtype=np.float64)
+        return counts / counts.sum(axis=1, keepdims=True)
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """Return the predicted class of each row."""
+        return self.classes_[np.argmax(self.predict_proba(features), axis=1)]
+
+    def score(self, features: np.ndarray, target: np.ndarray) -> float:
+        """Return the accuracy on the given rows."""
+        return float(np.mean(self.predict(features) == np.asarray(target)))
+
+
+def list_versions(registry_dir: str = MODEL_REGISTRY_DIR) -> List[str]:
+    """
+    List the published versions of the registry.
+
+    Args:
+        registry_dir: Registry directory
+
+    Returns:
+        List[str]: Version names in increasing order
+    """
+    if not os.path.isdir(registry_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(registry_dir)
+        if name.startswith('v') and os.path.exists(os.path.join(registry_dir, name, MANIFEST_FILE))
+    )
+
+
+def get_current_version(registry_dir: str = MODEL_REGISTRY_DIR) -> Optional[str]:
+    """
+    Return the promoted version, or None if nothing has been promoted.
+
+    Args:
+        registry_dir: Registry directory
+    """
+    try:
+        with open(os.path.join(registry_dir, CURRENT_FILE)) as file:
+            return file.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _reserve_version_dir(registry_dir: str) -> str:
+    """
+    Create the directory of the next version number and return the version name.
+
+    The directory is created exclusively, so concurrent publishers never get
+    the same number; a publisher that loses the race moves on to the next one.
+    Directories left by an interrupted publish keep their number reserved.
+    """
+    os.makedirs(registry_dir, exist_ok=True)
+    while True:
+        numbers = [int(name[1:]) for name in os.listdir(registry_dir) if name.startswith('v') and name[1:].isdigit()]
+        version = f"v{max(numbers, default=0) + 1:04d}"
+        try:
+            os.makedirs(os.path.join(registry_dir, version), exist_ok=False)
+            return version
+        except FileExistsError:
+            continue
+
+
+def save_model_version(model, registry_dir: str = MODEL_REGISTRY_DIR, metadata: Optional[dict] = None) -> str:
+    """
+    Publish a fitted model as a new registry version.
+
+    Decision trees are exported as raw .npy node arrays; other estimators are
+    saved with uncompressed joblib so their arrays can be memory-mapped. The
+    version directory is reserved exclusively and the manifest is written
+    last, with an atomic rename, so readers never see a partial version.
+
+    Args:
+        model: Fitted scikit-learn estimator
+        registry_dir: Registry directory
+        metadata: Extra fields stored in the manifest
+
+    Returns:
+        str: Name of the new version (not yet promoted)
+    """
+    version = _reserve_version_dir(registry_dir)
+    version_dir = os.path.join(registry_dir, version)
+
+    manifest = dict(metadata or {}, estimator=type(model).__name__, created=time.time())
+    if isinstance(model, DecisionTreeClassifier) and model.n_outputs_ == 1:
+        tree = model.tree_
+        for name in TREE_ARRAYS:
+            np.save(os.path.join(version_dir, f"{name}.npy"), np.ascontiguousarray(getattr(tree, name)))
+        manifest.update(format='tree_arrays', classes=model.classes_.tolist())
+    else:
+        joblib.dump(model, os.path.join(version_dir, 'model.joblib'))
+        manifest.update(format='joblib')
+
+    # list_versions only reports directories with a manifest
+    temp_path = os.path.join(version_dir, f".{MANIFEST_FILE}.{os.getpid()}.tmp")
+    with open(temp_path, 'w') as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(temp_path, os.path.join(version_dir, MANIFEST_FILE))
+    return version
+
+
+def load_model_version(version: str, registry_dir: str = MODEL_REGISTRY_DIR):
+    """
+    Load a registry version with its arrays memory-mapped read-only.
+
+    Args:
+        version: Version name
+        registry_dir: Registry directory
+
+    Returns:
+        Estimator exposing predict / predict_proba / score
+
+    Raises:
+        FileNotFoundError: If the version does not exist
+    """
+    version_dir = os.path.join(registry_dir, version)
+    manifest_path = os.path.join(version_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError(f"Model version not found: {version}")
+    with open(manifest_path) as file:
+        manifest = json.load(file)
+
+    if manifest['format'] == 'tree_arrays':
+        arrays = {
+            name: np.load(os.path.join(version_dir, f"{name}.npy"), mmap_mode='r')
+            for name in TREE_ARRAYS
+        }
+        return MmapTreeClassifier(classes=manifest['classes'], **arrays)
+    return joblib.load(os.path.join(version_dir, 'model.joblib'), mmap_mode='r')
+
+
+def promote_version(version: str, registry_dir: str = MODEL_REGISTRY_DIR) -> None:
+    """
+    Make a version the served one by atomically replacing the CURRENT pointer.
+
+    Args:
+        version: Version name
+        registry_dir: Registry directory
+
+    Raises:
+        FileNotFoundError: If the version does not exist
+    """
+    if version not in list_versions(registry_dir):
+        raise FileNotFoundError(f"Model version not found: {version}")
+    temp_path = os.path.join(registry_dir, f".{CURRENT_FILE}.{os.getpid()}.tmp")
+    with open(temp_path, 'w') as file:
+        file.write(version)
+    os.replace(temp_path, os.path.join(registry_dir, CURRENT_FILE))
+
+
+class ModelRegistry:
+    """
+    Serve the promoted registry version and hot-swap it when CURRENT changes.
+
+    The active (version, model) pair is replaced with a single reference
+    assignment, so a request that already called get() keeps using the model
+    it received while new requests see the promoted one.
+    """
+
+    def __init__(self, registry_dir: str = MODEL_REGISTRY_DIR, poll_interval: float = MODEL_REGISTRY_CONFIG['poll_interval']):
+        self.registry_dir = registry_dir
+        self.poll_interval = poll_interval
+        self._active: Tuple[Optional[str], object] = (None, None)
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+
+    def get(self) -> Tuple[Optional[str], object]:
+        """
+        Return the served (version, model) pair, checking for a promotion at most once per poll interval.
+
+        Returns:
+            Tuple[Optional[str], estimator]: (None, None) if nothing has been promoted
+        """
+        if time.monotonic() >= self._next_check:
+            self.refresh()
+        return self._active
+
+    def refresh(self) -> Optional[str]:
+        """
+        Load and swap in the promoted version if it differs from the served one.
+
+        Returns:
+            Optional[str]: The served version after the refresh
+        """
+        with self._lock:
+            self._next_check = time.monotonic() + self.poll_interval
+            version = get_current_version(self.registry_dir)
+            if version is not None and version != self._active[0]:
+                self._active = (version, load_model_version(version, self.registry_dir))
+            return self._active[0]
@@ -0,0 +1,235 @@
+"""
+Similar passenger index utilities for the Air Passenger Satisfaction application.
+This module builds a KD-tree/ball-tree over standardized model features offline,
+persists it with joblib and memory-maps it at startup so every worker shares
+one copy of the index through the page cache.
+"""
+import os
+from typing import Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.neighbors import BallTree, KDTree
+
+from src.config.constants import NEIGHBOR_INDEX_CONFIG, NEIGHBOR_INDEX_PATH
+
+TREE_CLASSES = {
+    'kd_tree': KDTree,
+    'ball_tree': BallTree
+}
+
+# k-means needs enough sample rows per cluster to place the centroids well
+MIN_ROWS_PER_LIST = 39
+
+# Upper bound on the elements of the per-block temporaries of an approximate query
+QUERY_BLOCK_ELEMENTS = 1 << 22
+
+
+def build_neighbor_index(
+    features: np.ndarray,
+    target: np.ndarray,
+    algorithm: str = NEIGHBOR_INDEX_CONFIG['algorithm'],
+    leaf_size: int = NEIGHBOR_INDEX_CONFIG['leaf_size'],
+    n_lists: Optional[int] = NEIGHBOR_INDEX_CONFIG['n_lists'],
+    training_sample: int = NEIGHBOR_INDEX_CONFIG['training_sample'],
+    random_state: int = 0
+) -> Dict[str, np.ndarray]:
+    """
+    Build an exact tree index plus a coarse inverted-list index over standardized features.
+
+    The tree answers exact queries. For approximate queries, rows are grouped
+    into n_lists k-means clusters and stored contiguously by cluster, so a
+    query only scans the rows of its n_probe nearest clusters.
+
+    Args:
+        features: Feature matrix in the training layout
+        target: Satisfaction codes aligned with the feature rows
+        algorithm: 'kd_tree' or 'ball_tree'
+        leaf_size: Leaf size of the tree
+        n_lists: Number of coarse clusters for approximate queries; None derives
+            NEIGHBOR_INDEX_CONFIG['lists_per_sqrt_rows'] * sqrt(rows)
+        training_sample: Minimum number of rows used to fit the coarse clusters
+        random_state: Seed for the cluster fitting sample
+
+    Returns:
+        Dict[str, np.ndarray]: Index components ready for save_neighbor_index
+    """
+    mean = features.mean(axis=0)
+    scale = features.std(axis=0)
+    scale[scale == 0] = 1.0
+    scaled = (features - mean) / scale
+
+    tree = TREE_CLASSES[algorithm](scaled, leaf_size=leaf_size)
+
+    rng = np.random.default_rng(random_state)
+    if n_lists is None:
+        n_lists = int(np.ceil(NEIGHBOR_INDEX_CONFIG['lists_per_sqrt_rows'] * np.sqrt(len(scaled))))
+    n_lists = max(1, min(n_lists, len(scaled) // MIN_ROWS_PER_LIST))
+    sample_size = min(max(training_sample, n_lists * MIN_ROWS_PER_LIST), len(scaled))
+    sample = scaled[rng.choice(len(scaled), size=sample_size, replace=False)]
+    quantizer = MiniBatchKMeans(n_clusters=n_lists, n_init=3, random_state=random_state).fit(sample)
+    assignments = quantizer.predict(scaled)
+    order = np.argsort(assignments, kind='stable')
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=n_lists))])
+
+    return {
+        'tree': tree,
+        'mean': mean,
+        'scale': scale,
+        'target': np.asarray(target),
+        'centroids': quantizer.cluster_centers_.astype(np.float32),
+        'list_rows': order,
+        'list_offsets': offsets,
+        'list_data': np.ascontiguousarray(scaled[order], dtype=np.float32)
+    }
+
+
+def save_neighbor_index(index: Dict[str, np.ndarray], path: str = NEIGHBOR_INDEX_PATH) -> None:
+    """
+    Persist an index uncompressed so it can be memory-mapped, replacing any previous file atomically.
+
+    Args:
+        index: Index returned by build_neighbor_index
+        path: Destination path
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    joblib.dump(index, temp_path)
+    os.replace(temp_path, path)
+
+
+def load_neighbor_index(path: str = NEIGHBOR_INDEX_PATH) -> Dict[str, np.ndarray]:
+    """
+    Memory-map a persisted index.
+
+    Args:
+        path: Path of the persisted index
+
+    Returns:
+        Dict[str, np.ndarray]: Index whose arrays are read-only memory maps
+
+    Raises:
+        FileNotFoundError: If the index file is not found
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Neighbor index not found at: {path}")
+    return joblib.load(path, mmap_mode='r')
+
+
+def _scan_lists(
+    index: Dict[str, np.ndarray],
+    queries: np.ndarray,
+    probes: np.ndarray,
+    k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Scan the probed clusters of a block of queries at once and keep the k closest rows of each."""
+    offsets = index['list_offsets']
+    starts = offsets[probes].ravel()
+    lengths = offsets[probes + 1].ravel() - starts
+    counts = lengths.reshape(probes.shape).sum(axis=1)
+
+    distances = np.full((len(queries), k), np.inf)
+    rows = np.full((len(queries), k), -1, dtype=np.int64)
+    if counts.max() == 0:
+        return distances, rows
+
+    # Flatten the probed lists of every query into one gather
+    total = int(lengths.sum())
+    positions = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(total)
+    query_ids = np.repeat(np.arange(len(queries)), counts)
+    differences = index['list_data'][positions] - queries[query_ids]
+    candidate_distances = np.sqrt(np.einsum('ij,ij->i', differences, differences))
+
+    # Lay the ragged candidates out as one padded row per query
+    columns = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    padded_distances = np.full((len(queries), counts.max()), np.inf)
+    padded_distances[query_ids, columns] = candidate_distances
+    padded_positions = np.full((len(queries), counts.max()), -1, dtype=np.int64)
+    padded_positions[query_ids, columns] = positions
+
+    found = min(k, padded_distances.shape[1])
+    nearest = np.argpartition(padded_distances, found - 1, axis=1)[:, :found]
+    nearest_distances = np.take_along_axis(padded_distances, nearest, axis=1)
+    order = np.argsort(nearest_distances, axis=1)
+    nearest = np.take_along_axis(nearest, order, axis=1)
+    nearest_positions = np.take_along_axis(padded_positions, nearest, axis=1)
+
+    distances[:, :found] = np.take_along_axis(nearest_distances, order, axis=1)
+    rows[:, :found] = np.where(nearest_positions >= 0, index['list_rows'][nearest_positions], -1)
+    return distances, rows
+
+
+def _query_approximate(
+    index: Dict[str, np.ndarray],
+    scaled: np.ndarray,
+    k: int,
+    n_probe: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Scan the n_probe nearest coarse clusters of each query and keep the k closest rows."""
+    centroids = index['centroids']
+    offsets = index['list_offsets']
+    n_probe = min(n_probe, len(centroids))
+    centroid_norms = np.einsum('ij,ij->i', centroids, centroids)
+
+    # Size query blocks so neither the centroid distances nor the gathered candidates grow with the batch
+    candidates_per_query = n_probe * int(np.diff(offsets).max()) * scaled.shape[1]
+    block = max(1, QUERY_BLOCK_ELEMENTS // max(len(centroids), candidates_per_query))
+
+    distances = np.full((len(scaled), k), np.inf)
+    rows = np.full((len(scaled), k), -1, dtype=np.int64)
+    for start in range(0, len(scaled), block):
+        queries = scaled[start:start + block]
+        # ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2; ||x||^2 does not change the ranking of a query's centroids
+        centroid_distances = centroid_norms[None, :] - 2 * queries @ centroids.T
+        probes = np.argpartition(centroid_distances, n_probe - 1, axis=1)[:, :n_probe]
+        distances[start:start + block], rows[start:start + block] = _scan_lists(index, queries, probes, k)
+    return distances, rows
+
+
+def query_neighbors(
+    index: Dict[str, np.ndarray],
+    profiles: np.ndarray,
+    k: int = NEIGHBOR_INDEX_CONFIG['default_k'],
+    approximate: bool = False,
+    n_probe: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k most similar passengers for a batch of profiles.
+
+    Args:
+        index: Index returned by build_neighbor_index or load_neighbor_index
+        profiles: Raw (unscaled) feature rows in the training layout
+        k: Number of neighbors per profile
+        approximate: Scan only the nearest coarse clusters instead of querying the tree
+        n_probe: Clusters scanned per approximate query; defaults to NEIGHBOR_INDEX_CONFIG
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Distances in standardized units and row
+        numbers of the neighbors, both shaped (n_profiles, k). Approximate
+        queries pad missing neighbors with inf / -1.
+    """
+    scaled = (np.atleast_2d(profiles).astype(np.float64) - index['mean']) / index['scale']
+    if approximate:
+        return _query_approximate(
+            index,
+            scaled,
+            k,
+            n_probe if n_probe is not None else NEIGHBOR_INDEX_CONFIG['n_probe']
+        )
+    return index['tree'].query(scaled, k=min(k, len(index['target'])))
+
+
+def get_neighbor_features(index: Dict[str, np.ndarray], rows: np.ndarray) -> np.ndarray:
+    """
+    Recover the raw feature values of indexed rows from the standardized tree data.
+
+    Args:
+        index: Index returned by build_neighbor_index or load_neighbor_index
+        rows: Row numbers returned by query_neighbors
+
+    Returns:
+        np.ndarray: Raw feature values, one row per requested row number
+    """
+    data = index['tree'].get_arrays()[0]
+    return np.round(data[rows] * index['scale'] + index['mean'], 6)
@@ -0,0 +1,82 @@
+"""
+Process pool helpers for the Air Passenger Satisfaction application.
+This module shares NumPy arrays with worker processes through shared memory
+so large matrices are copied once instead of being pickled with every task.
+"""
+import os
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+# (shared memory block name, array shape, dtype string)
+SharedArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+def resolve_worker_count(n_jobs: Optional[int]) -> int:
+    """
+    Resolve a requested worker count into a positive number of processes.
+
+    Args:
+        n_jobs: Requested worker count; None or -1 uses every available core
+
+    Returns:
+        int: Number of worker processes to start
+    """
+    available = os.cpu_count() or 1
+    if n_jobs is None or n_jobs == -1:
+        return available
+    return max(1, min(n_jobs, available))
+
+
+def share_array(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, SharedArraySpec]:
+    """
+    Copy an array into a new shared memory block.
+
+    The caller owns the returned block and must close and unlink it once the
+    workers are done (see release_shared_array).
+
+    Args:
+        array: Array to share
+
+    Returns:
+        Tuple[SharedMemory, SharedArraySpec]: The shared memory block and the
+        picklable spec workers use to attach to it
+    """
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def attach_shared_array(spec: SharedArraySpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Attach to an array shared by share_array.
+
+    The returned block must stay referenced for as long as the array is used.
+
+    Args:
+        spec: Spec returned by share_array
+
+    Returns:
+        Tuple[SharedMemory, np.ndarray]: The attached block and a read-only array view
+    """
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    array.flags.writeable = False
+
+    return block, array
+
+
+def release_shared_array(block: shared_memory.SharedMemory) -> None:
+    """
+    Close and unlink a shared memory block created by share_array.
+
+    Args:
+        block: Shared memory block to release
+    """
+    block.close()
+    block.unlink()
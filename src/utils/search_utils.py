@@ -0,0 +1,291 @@
+"""
+Hyperparameter search utilities for the Air Passenger Satisfaction application.
+This module runs successive halving and hyperband over the decision tree, KNN
+and SVM families used in the notebook, evaluating configurations in parallel
+on growing subsets of the data.
+"""
+import json
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import ParameterGrid, StratifiedKFold
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+from src.config.constants import SEARCH_CONFIG, SEARCH_SPACE
+from src.utils.parallel_utils import (
+    attach_shared_array,
+    release_shared_array,
+    resolve_worker_count,
+    share_array
+)
+
+# Estimator class and whether the family needs standardized features
+MODEL_FAMILIES = {
+    'decision_tree': (DecisionTreeClassifier, False),
+    'knn': (KNeighborsClassifier, True),
+    'svm': (SVC, True)
+}
+
+# A candidate is a (family, params) pair
+Candidate = Tuple[str, Dict]
+
+# Per-process state populated by the pool initializer
+_worker_state = {}
+
+
+def build_candidates(search_space: Dict[str, Dict[str, List]] = SEARCH_SPACE) -> List[Candidate]:
+    """
+    Expand the per-family search space into a flat list of candidates.
+
+    Args:
+        search_space: Mapping of family name to a parameter grid
+
+    Returns:
+        List[Candidate]: Every (family, params) combination
+    """
+    return [
+        (family, params)
+        for family, grid in search_space.items()
+        for params in ParameterGrid(grid)
+    ]
+
+
+def build_estimator(family: str, params: Dict):
+    """
+    Create an unfitted estimator for a candidate.
+
+    Families that need standardized features are wrapped in a pipeline so the
+    saved artifact accepts raw features like the notebook models.
+
+    Args:
+        family: Model family name (a MODEL_FAMILIES key)
+        params: Estimator parameters
+
+    Returns:
+        Unfitted scikit-learn estimator
+    """
+    estimator_class, needs_scaling = MODEL_FAMILIES[family]
+    estimator = estimator_class(**params)
+    if needs_scaling:
+        return make_pipeline(StandardScaler(), estimator)
+    return estimator
+
+
+def compute_rung_resources(n_rows: int, min_resources: int, eta: int) -> List[int]:
+    """
+    Compute the number of rows used by each successive halving rung.
+
+    The last rung always uses every row and each earlier rung uses 1/eta of the next.
+
+    Args:
+        n_rows: Total number of rows available
+        min_resources: Minimum number of rows for the first rung
+        eta: Reduction factor between rungs
+
+    Returns:
+        List[int]: Rows per rung, in increasing order
+    """
+    min_resources = min(min_resources, n_rows)
+    n_rungs = int(math.floor(math.log(n_rows / min_resources, eta) + 1e-9)) + 1
+    return [int(n_rows / eta ** (n_rungs - 1 - rung)) for rung in range(n_rungs)]
+
+
+def _init_search_worker(features_spec, target_spec, order, cv, random_state) -> None:
+    """Attach a worker process to the shared data and reset its fold cache."""
+    features_block, features = attach_shared_array(features_spec)
+    target_block, target = attach_shared_array(target_spec)
+    _worker_state.update(
+        features=features,
+        target=target,
+        blocks=(features_block, target_block),
+        order=order,
+        cv=cv,
+        random_state=random_state,
+        folds={}
+    )
+
+
+def _get_encoded_folds(n_resources: int, scaled: bool) -> List[Tuple[np.ndarray, ...]]:
+    """
+    Return the cached (X_train, X_test, y_train, y_test) folds for a data subset.
+
+    Folds are derived deterministically from the shared row order so every
+    worker builds the same splits. Only the current rung is kept; standardized
+    copies are built once per fold and reused by every KNN and SVM candidate.
+    """
+    cache = _worker_state['folds']
+    key = (n_resources, scaled)
+    if key not in cache:
+        for stale in [cached for cached in cache if cached[0] != n_resources]:
+            del cache[stale]
+
+        rows = _worker_state['order'][:n_resources]
+        features = _worker_state['features'][rows]
+        target = _worker_state['target'][rows]
+        splitter = StratifiedKFold(
+            n_splits=_worker_state['cv'],
+            shuffle=True,
+            random_state=_worker_state['random_state']
+        )
+        folds = []
+        for train_index, test_index in splitter.split(features, target):
+            features_train, features_test = features[train_index], features[test_index]
+            if scaled:
+                scaler = StandardScaler().fit(features_train)
+                features_train = scaler.transform(features_train)
+                features_test = scaler.transform(features_test)
+            folds.append((features_train, features_test, target[train_index], target[test_index]))
+        cache[key] = folds
+    return cache[key]
+
+
+def _evaluate_candidate(family: str, params: Dict, n_resources: int) -> Tuple[float, float]:
+    """Return the mean cross-validated accuracy and elapsed seconds for one candidate."""
+    start = time.perf_counter()
+    estimator_class, needs_scaling = MODEL_FAMILIES[family]
+    scores = []
+    for features_train, features_test, target_train, target_test in _get_encoded_folds(n_resources, needs_scaling):
+        estimator = estimator_class(**params).fit(features_train, target_train)
+        scores.append(estimator.score(features_test, target_test))
+    return float(np.mean(scores)), time.perf_counter() - start
+
+
+def _run_halving(
+    executor: ProcessPoolExecutor,
+    candidates: List[Candidate],
+    resources: List[int],
+    eta: int,
+    bracket: int
+) -> List[Dict]:
+    """
+    Run one successive halving bracket and return a leaderboard record per evaluation.
+
+    Each rung evaluates the surviving candidates in parallel and only the best
+    ceil(n / eta) advance, so losing configurations stop early on small subsets.
+    """
+    records = []
+    survivors = list(range(len(candidates)))
+    for rung, n_resources in enumerate(resources):
+        results = list(executor.map(
+            _evaluate_candidate,
+            [candidates[index][0] for index in survivors],
+            [candidates[index][1] for index in survivors],
+            [n_resources] * len(survivors)
+        ))
+        for index, (score, seconds) in zip(survivors, results):
+            family, params = candidates[index]
+            records.append({
+                'bracket': bracket,
+                'rung': rung,
+                'family': family,
+                'params': json.dumps(params, sort_keys=True),
+                'n_resources': n_resources,
+                'mean_score': score,
+                'seconds': seconds
+            })
+
+        if rung == len(resources) - 1 or len(survivors) == 1:
+            break
+        ranked = sorted(zip(survivors, results), key=lambda item: item[1][0], reverse=True)
+        survivors = [index for index, _ in ranked[:max(1, math.ceil(len(survivors) / eta))]]
+    return records
+
+
+def run_search(
+    features: np.ndarray,
+    target: np.ndarray,
+    candidates: Optional[List[Candidate]] = None,
+    hyperband: bool = False,
+    eta: int = SEARCH_CONFIG['eta'],
+    min_resources: int = SEARCH_CONFIG['min_resources'],
+    cv: int = SEARCH_CONFIG['cv'],
+    n_jobs: Optional[int] = SEARCH_CONFIG['n_jobs'],
+    random_state: int = SEARCH_CONFIG['random_state']
+) -> Tuple[pd.DataFrame, object, Dict]:
+    """
+    Search the model families with successive halving (or hyperband) and refit the winner.
+
+    Successive halving starts every candidate on min_resources rows and keeps the
+    best 1/eta per rung until the full dataset. Hyperband additionally runs
+    brackets that start fewer, randomly sampled candidates on larger subsets,
+    hedging against configurations that only shine with more data.
+
+    Args:
+        features: Feature matrix in the training layout
+        target: Target vector
+        candidates: Candidates to search; defaults to the expanded SEARCH_SPACE
+        hyperband: Run hyperband brackets instead of a single halving bracket
+        eta: Reduction factor between rungs
+        min_resources: Rows used by the first rung
+        cv: Number of stratified cross-validation folds
+        n_jobs: Number of worker processes; None uses every available core
+        random_state: Seed for the row order, folds and hyperband sampling
+
+    Returns:
+        Tuple[pd.DataFrame, estimator, Dict]: A tuple containing:
+            - leaderboard: Every evaluation, best full-data results first
+            - model: Winning candidate refit on all rows
+            - summary: Winner, wall time and rows fitted relative to an exhaustive grid
+    """
+    start = time.perf_counter()
+    candidates = candidates if candidates is not None else build_candidates()
+    rng = np.random.default_rng(random_state)
+    order = rng.permutation(len(target))
+    resources = compute_rung_resources(len(target), min_resources, eta)
+
+    # (bracket, candidate subset, rung resources) triples
+    if hyperband:
+        brackets = []
+        for bracket in range(len(resources)):
+            bracket_resources = resources[bracket:]
+            n_candidates = min(len(candidates), math.ceil(
+                len(resources) / len(bracket_resources) * eta ** (len(bracket_resources) - 1)
+            ))
+            chosen = rng.choice(len(candidates), size=n_candidates, replace=False)
+            brackets.append((bracket, [candidates[index] for index in sorted(chosen)], bracket_resources))
+    else:
+        brackets = [(0, candidates, resources)]
+
+    features_block, features_spec = share_array(features)
+    target_block, target_spec = share_array(target)
+    records = []
+    try:
+        with ProcessPoolExecutor(
+            max_workers=resolve_worker_count(n_jobs),
+            initializer=_init_search_worker,
+            initargs=(features_spec, target_spec, order, cv, random_state)
+        ) as executor:
+            for bracket, bracket_candidates, bracket_resources in brackets:
+                records.extend(_run_halving(executor, bracket_candidates, bracket_resources, eta, bracket))
+    finally:
+        release_shared_array(features_block)
+        release_shared_array(target_block)
+
+    leaderboard = pd.DataFrame(records).sort_values(
+        ['n_resources', 'mean_score'], ascending=False, ignore_index=True
+    )
+    best = leaderboard.iloc[0]
+    model = build_estimator(best['family'], json.loads(best['params'])).fit(features, target)
+
+    # A row budget, not a time ratio: fit time grows faster than linearly with rows for some families (SVC)
+    fit_rows = float((leaderboard['n_resources'] * cv).sum())
+    exhaustive_rows = float(len(candidates) * len(target) * cv)
+    summary = {
+        'family': best['family'],
+        'params': json.loads(best['params']),
+        'mean_score': float(best['mean_score']),
+        'evaluations': len(leaderboard),
+        'seconds': time.perf_counter() - start,
+        'fit_rows': fit_rows,
+        'exhaustive_fit_rows': exhaustive_rows,
+        'row_budget_fraction': fit_rows / exhaustive_rows
+    }
+    return leaderboard, model, summary
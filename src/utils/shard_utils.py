@@ -0,0 +1,425 @@
+"""
+Sharded aggregation utilities for the Air Passenger Satisfaction application.
+This module splits the dataset into row shards on disk and computes group
+aggregates shard by shard in a process pool, so datasets larger than memory
+can be aggregated with bounded per-worker memory.
+
+Shard layout:
+    shards/
+        manifest.json         columns, dtypes and shard row counts
+        summaries.joblib      dashboard aggregates and sketches (build_dashboard_summaries)
+        shard_00000/<n>.npy   one array per column, memory-mapped by workers
+
+All dashboard aggregates and distribution sketches are computed offline in a
+single pass (each worker task reads one shard once and returns every partial
+result) and saved next to the manifest; serving workers only load that file.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.config.constants import (
+    AGGREGATION_CONFIG,
+    CLASS_MAPPINGS,
+    CSV_ENCODINGS,
+    CUSTOMER_TYPE_MAPPINGS,
+    DISTRIBUTION_COLUMNS,
+    GENDER_MAPPINGS,
+    RATING_COLUMNS,
+    SATISFACTION_MAPPINGS,
+    TRAVEL_TYPE_MAPPINGS
+)
+from src.utils.parallel_utils import resolve_worker_count
+from src.utils.sketch_utils import SketchTable, build_distribution_sketches, merge_sketch_tables
+
+MANIFEST_FILE = 'manifest.json'
+SUMMARIES_FILE = 'summaries.joblib'
+
+# Code-to-label mappings applied by preprocess_airline_data, keyed by column name
+LABEL_MAPPINGS = {
+    'satisfaction': SATISFACTION_MAPPINGS,
+    'Gender': GENDER_MAPPINGS,
+    'Customer Type': CUSTOMER_TYPE_MAPPINGS,
+    'Type of Travel': TRAVEL_TYPE_MAPPINGS,
+    'Class': CLASS_MAPPINGS
+}
+
+# Aggregates shown by the dashboard pages: name -> (keys, value column, aggregation, label keys)
+DASHBOARD_AGGREGATES = {
+    'satisfaction_by_class': (['satisfaction', 'Class'], 'Online boarding', 'count', True),
+    'satisfaction_by_customer_type': (['satisfaction', 'Customer Type', 'Class'], 'Online boarding', 'count', True),
+    'satisfaction_by_gender': (['satisfaction', 'Gender', 'Class'], 'Online boarding', 'count', True),
+    'satisfaction_by_travel_type': (['satisfaction', 'Type of Travel', 'Class'], 'Online boarding', 'count', True),
+    'satisfaction_by_class_and_age': (['Class', 'Age'], 'satisfaction', 'sum', False)
+}
+DASHBOARD_AGGREGATES.update({
+    f"ratings {column}": ([column], 'Online boarding', 'count', True)
+    for column in RATING_COLUMNS
+})
+
+
+def _column_file(column: str) -> str:
+    """Return a file name safe for any column name (e.g. 'Departure/Arrival time convenient')."""
+    return column.replace('/', '_') + '.npy'
+
+
+def iter_frame_chunks(data: pd.DataFrame, rows_per_shard: int = AGGREGATION_CONFIG['rows_per_shard']) -> Iterator[pd.DataFrame]:
+    """
+    Split an in-memory frame into row windows.
+
+    Args:
+        data: Raw airline data with numeric codes
+        rows_per_shard: Rows per window
+
+    Yields:
+        pd.DataFrame: Consecutive row windows
+    """
+    for start in range(0, len(data), rows_per_shard):
+        yield data.iloc[start:start + rows_per_shard]
+
+
+def iter_csv_chunks(paths: Sequence[str], rows_per_shard: int = AGGREGATION_CONFIG['rows_per_shard']) -> Iterator[pd.DataFrame]:
+    """
+    Read raw airline CSV exports in chunks and encode them like the notebook.
+
+    Args:
+        paths: CSV files with the Invistico_Airline.csv layout
+        rows_per_shard: Rows read per chunk
+
+    Yields:
+        pd.DataFrame: Chunks with categorical labels replaced by numeric codes
+    """
+    for path in paths:
+        for chunk in pd.read_csv(path, chunksize=rows_per_shard):
+            for column, encoding in CSV_ENCODINGS.items():
+                chunk[column] = chunk[column].map(encoding)
+            yield chunk
+
+
+def write_shards(chunks: Iterable[pd.DataFrame], shard_dir: str) -> Dict:
+    """
+    Write each chunk as a shard of per-column .npy files.
+
+    Only one chunk is held in memory at a time.
+
+    Args:
+        chunks: Raw-coded frames with identical columns (e.g. from iter_csv_chunks)
+        shard_dir: Destination directory
+
+    Returns:
+        Dict: The shard manifest
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    # Summaries of a previous build no longer match the shards
+    if os.path.exists(os.path.join(shard_dir, SUMMARIES_FILE)):
+        os.remove(os.path.join(shard_dir, SUMMARIES_FILE))
+    manifest = {'columns': None, 'shards': []}
+    for chunk in chunks:
+        if manifest['columns'] is None:
+            manifest['columns'] = {column: str(dtype) for column, dtype in chunk.dtypes.items()}
+        name = f"shard_{len(manifest['shards']):05d}"
+        os.makedirs(os.path.join(shard_dir, name), exist_ok=True)
+        for column in manifest['columns']:
+            np.save(os.path.join(shard_dir, name, _column_file(column)), chunk[column].to_numpy())
+        manifest['shards'].append({'name': name, 'rows': len(chunk)})
+
+    with open(os.path.join(shard_dir, MANIFEST_FILE), 'w') as file:
+        json.dump(manifest, file, indent=2)
+    return manifest
+
+
+def load_manifest(shard_dir: str) -> Dict:
+    """
+    Load the manifest of a shard directory.
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest
+    """
+    path = os.path.join(shard_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Shard manifest not found at: {path}")
+    with open(path) as file:
+        return json.load(file)
+
+
+def iter_shard_chunks(shard_dir: str, rows_per_chunk: int) -> Iterator[pd.DataFrame]:
+    """
+    Read every column of the shards back as row windows.
+
+    Columns are memory-mapped, so only one window is held in memory at a time.
+
+    Args:
+        shard_dir: Directory written by write_shards
+        rows_per_chunk: Rows per window
+
+    Yields:
+        pd.DataFrame: Consecutive raw-coded row windows, columns in their original order
+    """
+    manifest = load_manifest(shard_dir)
+    for shard in manifest['shards']:
+        arrays = {
+            column: np.load(os.path.join(shard_dir, shard['name'], _column_file(column)), mmap_mode='r')
+            for column in manifest['columns']
+        }
+        for start in range(0, shard['rows'], rows_per_chunk):
+            yield pd.DataFrame({column: np.asarray(array[start:start + rows_per_chunk]) for column, array in arrays.items()})
+
+
+def _summarize_shard(
+    shard_path: str,
+    specs: Dict[str, Tuple[List[str], str, str, bool]],
+    sketch_columns: Sequence[str]
+) -> Tuple[Dict[str, pd.Series], SketchTable]:
+    """Compute every partial aggregate and sketch of one shard, reading each needed column once."""
+    columns = [column for keys, value_column, _, _ in specs.values() for column in keys + [value_column]]
+    if sketch_columns:
+        columns += ['Class', 'satisfaction'] + list(sketch_columns)
+    frame = pd.DataFrame({
+        column: np.load(os.path.join(shard_path, _column_file(column)), mmap_mode='r')
+        for column in dict.fromkeys(columns)
+    })
+    partials = {
+        name: frame.groupby(keys)[value_column].agg(how)
+        for name, (keys, value_column, how, _) in specs.items()
+    }
+    sketches = build_distribution_sketches(frame, sketch_columns) if sketch_columns else {}
+    return partials, sketches
+
+
+def _merge_partials(partials: List[pd.Series], keys: List[str], value_column: str, label: bool) -> pd.DataFrame:
+    """Add up the partial results of every shard into one aggregate frame."""
+    totals = pd.concat(partials).groupby(level=list(range(len(keys)))).sum()
+    merged = totals.index.to_frame(index=False)
+    merged.columns = keys
+    if label:
+        for column in keys:
+            if column in LABEL_MAPPINGS:
+                merged[column] = merged[column].replace(LABEL_MAPPINGS[column])
+    merged['_value'] = totals.to_numpy()
+    if label:
+        merged = merged.sort_values(keys, ignore_index=True)
+
+    # Like pandas, a grouping column that is also aggregated is only returned once, as the aggregate
+    merged = merged.drop(columns=[value_column], errors='ignore')
+    return merged.rename(columns={'_value': value_column})
+
+
+def summarize_shards(
+    shard_dir: str,
+    specs: Dict[str, Tuple[List[str], str, str, bool]],
+    sketch_columns: Sequence[str] = (),
+    n_jobs: Optional[int] = AGGREGATION_CONFIG['n_jobs']
+) -> Tuple[Dict[str, pd.DataFrame], SketchTable]:
+    """
+    Compute several group aggregates and the distribution sketches in one pass over the shards.
+
+    One task per shard returns the partial result of every aggregate, so each
+    shard is read once however many aggregates are requested. Counts and sums
+    are additive and t-digests are mergeable, so the merged results equal the
+    single-frame ones. With label set, the key codes of an aggregate are
+    replaced by the descriptive labels and rows are ordered as a groupby on
+    preprocessed data would order them.
+
+    Args:
+        shard_dir: Directory written by write_shards
+        specs: Aggregate name to (keys, value column, 'count' or 'sum', label)
+        sketch_columns: Continuous columns to sketch per class x satisfaction cell
+        n_jobs: Number of worker processes; None uses every available core
+
+    Returns:
+        Tuple[Dict[str, pd.DataFrame], SketchTable]: Aggregates by name (key
+        columns followed by the aggregated value column) and the merged sketches
+    """
+    for _, _, how, _ in specs.values():
+        if how not in ('count', 'sum'):
+            raise ValueError(f"Unsupported aggregation: {how}")
+    shards = [os.path.join(shard_dir, shard['name']) for shard in load_manifest(shard_dir)['shards']]
+
+    with ProcessPoolExecutor(max_workers=min(resolve_worker_count(n_jobs), max(1, len(shards)))) as executor:
+        results = list(executor.map(
+            _summarize_shard,
+            shards,
+            [specs] * len(shards),
+            [list(sketch_columns)] * len(shards)
+        ))
+
+    aggregates = {
+        name: _merge_partials([partials[name] for partials, _ in results], keys, value_column, label)
+        for name, (keys, value_column, _, label) in specs.items()
+    }
+    return aggregates, merge_sketch_tables(*[sketches for _, sketches in results])
+
+
+def sharded_group_aggregate(
+    shard_dir: str,
+    keys: List[str],
+    value_column: str = 'Online boarding',
+    how: str = 'count',
+    label: bool = True,
+    n_jobs: Optional[int] = AGGREGATION_CONFIG['n_jobs']
+) -> pd.DataFrame:
+    """
+    Group and aggregate every shard in a process pool and merge the partial results.
+
+    Args:
+        shard_dir: Directory written by write_shards
+        keys: Group key columns
+        value_column: Column to aggregate
+        how: 'count' (non-null values) or 'sum'
+        label: Replace key codes with descriptive labels
+        n_jobs: Number of worker processes; None uses every available core
+
+    Returns:
+        pd.DataFrame: Key columns followed by the aggregated value column
+    """
+    aggregates, _ = summarize_shards(shard_dir, {'aggregate': (keys, value_column, how, label)}, n_jobs=n_jobs)
+    return aggregates['aggregate']
+
+
+def build_dashboard_summaries(shard_dir: str, n_jobs: Optional[int] = AGGREGATION_CONFIG['n_jobs']) -> str:
+    """
+    Compute every dashboard aggregate and distribution sketch in one pass and save them with the shards.
+
+    This is an offline step (run by build_shards.py and warmup.py); the file
+    is left untouched when it already exists, and write_shards removes it
+    when the shards are rewritten.
+
+    Args:
+        shard_dir: Directory written by write_shards
+        n_jobs: Number of worker processes; None uses every available core
+
+    Returns:
+        str: Path of the summaries file
+    """
+    path = os.path.join(shard_dir, SUMMARIES_FILE)
+    if os.path.exists(path):
+        return path
+
+    summaries = summarize_shards(shard_dir, DASHBOARD_AGGREGATES, DISTRIBUTION_COLUMNS, n_jobs=n_jobs)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    joblib.dump(summaries, temp_path)
+    os.replace(temp_path, path)
+    return path
+
+
+@lru_cache(maxsize=None)
+def get_dashboard_summaries(shard_dir: str) -> Tuple[Dict[str, pd.DataFrame], SketchTable]:
+    """
+    Load the dashboard aggregates and sketches saved by build_dashboard_summaries, once per process.
+
+    Nothing is computed here, so serving workers never start a process pool
+    or scan the shards. The pages share the cached result and must not modify it.
+
+    Args:
+        shard_dir: Directory written by write_shards
+
+    Returns:
+        Tuple[Dict[str, pd.DataFrame], SketchTable]: DASHBOARD_AGGREGATES by name and the sketches
+
+    Raises:
+        FileNotFoundError: If the summaries have not been built
+    """
+    path = os.path.join(shard_dir, SUMMARIES_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Shard summaries not found at: {path} (run python warmup.py)")
+    return joblib.load(path)
+
+
+def build_distribution_sketches_sharded(shard_dir: str) -> SketchTable:
+    """
+    Sharded equivalent of sketch_utils.build_distribution_sketches.
+
+    Args:
+        shard_dir: Directory written by write_shards
+
+    Returns:
+        SketchTable: Digests keyed by (class code, satisfaction code)
+    """
+    return get_dashboard_summaries(shard_dir)[1]
+
+
+def aggregate_satisfaction_by_class_sharded(shard_dir: str) -> pd.DataFrame:
+    """
+    Sharded equivalent of data_utils.aggregate_satisfaction_by_class.
+
+    Args:
+        shard_dir: Directory written by write_shards
+
+    Returns:
+        pd.DataFrame: Aggregated data with satisfaction counts per class
+    """
+    return get_dashboard_summaries(shard_dir)[0]['satisfaction_by_class']
+
+
+def aggregate_satisfaction_by_customer_type_sharded(shard_dir: str) -> pd.DataFrame:
+    """
+    Sharded equivalent of data_utils.aggregate_satisfaction_by_customer_type.
+
+    Args:
+        shard_dir: Directory written by write_shards
+
+    Returns:
+        pd.DataFrame: Aggregated data with satisfaction counts per customer type and class
+    """
+    return get_dashboard_summaries(shard_dir)[0]['satisfaction_by_customer_type']
+
+
+def aggregate_satisfaction_by_gender_sharded(shard_dir: str) -> pd.DataFrame:
+    """
+    Sharded equivalent of data_utils.aggregate_satisfaction_by_gender.
+
+    Args:
+        shard_dir: Directory written by write_shards
+
+    Returns:
+        pd.DataFrame: Aggregated data with satisfaction counts per gender and class
+    """
+    return get_dashboard_summaries(shard_dir)[0]['satisfaction_by_gender']
+
+
+def aggregate_satisfaction_by_travel_type_sharded(shard_dir: str) -> pd.DataFrame:
+    """
+    Sharded equivalent of data_utils.aggregate_satisfaction_by_travel_type.
+
+    Args:
+        shard_dir: Directory written by write_shards
+
+    Returns:
+        pd.DataFrame: Aggregated data with satisfaction counts per travel type and class
+    """
+    return get_dashboard_summaries(shard_dir)[0]['satisfaction_by_travel_type']
+
+
+def aggregate_satisfaction_by_class_and_age_sharded(shard_dir: str) -> pd.DataFrame:
+    """
+    Sharded equivalent of data_utils.aggregate_satisfaction_by_class_and_age.
+
+    Args:
+        shard_dir: Directory written by write_shards
+
+    Returns:
+        pd.DataFrame: Aggregated data with the satisfied count per class code and age
+    """
+    return get_dashboard_summaries(shard_dir)[0]['satisfaction_by_class_and_age']
+
+
+def aggregate_ratings_by_category_sharded(shard_dir: str, category: str) -> pd.DataFrame:
+    """
+    Sharded equivalent of data_utils.aggregate_ratings_by_category.
+
+    Args:
+        shard_dir: Directory written by write_shards
+        category: The category column name to aggregate by
+
+    Returns:
+        pd.DataFrame: Aggregated data with counts per category rating
+    """
+    if f"ratings {category}" in DASHBOARD_AGGREGATES:
+        return get_dashboard_summaries(shard_dir)[0][f"ratings {category}"]
+    return sharded_group_aggregate(shard_dir, [category])
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Hyperparameter search script for the Air Passenger Satisfaction models.
+This script runs successive halving (or hyperband) over the decision tree, KNN
+and SVM families, then saves the leaderboard and the winning model artifact.
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import joblib
+
+
+def parse_args():
+    """Parse command line arguments."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from src.config.constants import DATA_FILE_PATH, MODEL_FILE_PATH, SEARCH_CONFIG
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--hyperband', action='store_true', help='Run hyperband brackets instead of a single halving bracket')
+    parser.add_argument('--eta', type=int, default=SEARCH_CONFIG['eta'], help='Reduction factor between rungs')
+    parser.add_argument('--min-resources', type=int, default=SEARCH_CONFIG['min_resources'], help='Rows used by the first rung')
+    parser.add_argument('--cv', type=int, default=SEARCH_CONFIG['cv'], help='Number of cross-validation folds')
+    parser.add_argument('--n-jobs', type=int, default=SEARCH_CONFIG['n_jobs'], help='Worker processes (default: all cores)')
+    parser.add_argument('--output', default=SEARCH_CONFIG['output_path'], help='Path of the winning model artifact')
+    parser.add_argument('--leaderboard', default=SEARCH_CONFIG['leaderboard_path'], help='Path of the leaderboard CSV')
+    args = parser.parse_args()
+
+    # The served model and the dataset are tracked artifacts; publish a tuned model through manage_models.py instead
+    if os.path.abspath(args.output) in (os.path.abspath(MODEL_FILE_PATH), os.path.abspath(DATA_FILE_PATH)):
+        parser.error(f"--output must not overwrite {args.output}")
+    return args
+
+
+def main():
+    """Run the search and save its results."""
+    args = parse_args()
+
+    from src.utils.data_utils import get_model_features, load_airline_data
+    from src.utils.search_utils import run_search
+
+    features, target = get_model_features(load_airline_data())
+    leaderboard, model, summary = run_search(
+        features,
+        target,
+        hyperband=args.hyperband,
+        eta=args.eta,
+        min_resources=args.min_resources,
+        cv=args.cv,
+        n_jobs=args.n_jobs
+    )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    joblib.dump(model, args.output)
+    leaderboard.to_csv(args.leaderboard, index=False)
+
+    print("=" * 50)
+    print("Top configurations")
+    print("=" * 50)
+    print(leaderboard.head(10).to_string(index=False))
+    print(f"\n🏆 Winner: {summary['family']} {summary['params']} (accuracy {summary['mean_score']:.4f})")
+    print(f"⏱️  {summary['evaluations']} evaluations in {summary['seconds']:.1f}s")
+    print(f"📉 Rows fitted: {summary['row_budget_fraction']:.1%} of the equivalent exhaustive grid (a row budget, not wall time)")
+    print(f"💾 Model saved to {args.output}")
+    print(f"💾 Leaderboard saved to {args.leaderboard}")
+
+
+if __name__ == "__main__":
+    main()
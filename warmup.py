@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Warm-up and self-check script for the Air Passenger Satisfaction Dashboard.
+This script builds the offline caches (permutation importance, drift
+reference, shard summaries), imports the application and times the first (cold) call and repeated warm
+calls of every page callback against latency budgets. It exits non-zero when a cache build,
+the import or a callback fails, or a callback exceeds the budget, so it can gate a deploy before
+traffic arrives; failures are reported as failed checks in the JSON output too.
+"""
+import argparse
+import json
+import sys
+import time
+import traceback
+from pathlib import Path
+
+
+def parse_args():
+    """Parse command line arguments."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from src.config.constants import WARMUP_CONFIG
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--budget-ms', type=float, default=WARMUP_CONFIG['latency_budget_ms'], help='Maximum warm latency per check in milliseconds')
+    parser.add_argument('--cold-budget-ms', type=float, default=WARMUP_CONFIG['cold_budget_ms'], help='Maximum latency of the first call per check in milliseconds')
+    parser.add_argument('--repeats', type=int, default=WARMUP_CONFIG['repeats'], help='Warm runs per check')
+    parser.add_argument('--json', help='Write the timings to this JSON file')
+    return parser.parse_args()
+
+
+def build_caches():
+    """
+    List the offline cache builds the pages read from.
+
+    Returns:
+        list: (name, callable) pairs
+    """
+    from src.config.constants import AGGREGATION_CONFIG
+    from src.utils.drift_utils import save_drift_reference
+    from src.utils.importance_utils import build_feature_importance
+    from src.utils.shard_utils import build_dashboard_summaries
+
+    caches = [
+        ('importance cache', build_feature_importance),
+        ('drift reference', save_drift_reference)
+    ]
+    if AGGREGATION_CONFIG['shard_dir']:
+        caches.append(('shard summaries', lambda: build_dashboard_summaries(AGGREGATION_CONFIG['shard_dir'])))
+    return caches
+
+
+def build_checks():
+    """
+    List the callbacks served by the dashboard with realistic inputs.
+
+    Returns:
+        list: (name, callable) pairs
+    """
+    from src.pages import classification, distributions, drift, importance, pie_chart
+    from src.config.constants import CLASS_DROPDOWN_OPTIONS, DISTRIBUTION_COLUMNS
+
+    class_values = [option['value'] for option in CLASS_DROPDOWN_OPTIONS]
+    satisfaction_values = [option['value'] for option in distributions.SATISFACTION_DROPDOWN_OPTIONS]
+
+    checks = [
+        (f"classification {option['label']}", lambda value=option['value']: classification.update_classification_graphs(value))
+        for option in CLASS_DROPDOWN_OPTIONS
+    ]
+    checks.append(('ratings', lambda: pie_chart.update_rating_charts(None)))
+    checks += [
+        (f"distributions {column}", lambda column=column: distributions.update_distribution_charts(column, class_values, satisfaction_values))
+        for column in DISTRIBUTION_COLUMNS
+    ]
+    checks.append(('importance', lambda: importance.update_importance_chart(None)))
+    checks.append(('drift', lambda: drift.update_drift_charts(None)))
+    return checks
+
+
+def time_call(function):
+    """Run a callable and return its latency in milliseconds."""
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def run_step(name, function):
+    """
+    Run one cache build or application import and record it like a check.
+
+    Returns:
+        dict: Result entry; the step passes when it raises nothing
+    """
+    result = {'check': name, 'cold_ms': None, 'warm_ms': None, 'error': None}
+    try:
+        result['cold_ms'] = time_call(function)
+    except Exception:
+        result['error'] = traceback.format_exc(limit=3)
+    result['passed'] = result['error'] is None
+
+    if result['error']:
+        print(f"❌ {name}: failed\n{result['error']}")
+    else:
+        print(f"✅ {name} ready in {result['cold_ms'] / 1000:.1f}s")
+    return result
+
+
+def main():
+    """Warm the caches, time every check and report."""
+    args = parse_args()
+
+    print("=" * 50)
+    print("Air Passenger Satisfaction Dashboard - Warm-up")
+    print("=" * 50)
+
+    print("\n🔧 Building caches...")
+    results = [run_step(name, function) for name, function in build_caches()]
+
+    checks = []
+
+    def import_application():
+        import src.index  # noqa: F401 (registers every page and API route like gunicorn does)
+        checks.extend(build_checks())
+
+    print("\n📦 Importing the application...")
+    results.append(run_step('application import', import_application))
+    print(f"⏱️  Latency budgets: {args.cold_budget_ms:.0f} ms cold, {args.budget_ms:.0f} ms warm (slowest of {args.repeats} runs)\n")
+
+    for name, function in checks:
+        result = {'check': name, 'cold_ms': None, 'warm_ms': None, 'error': None}
+        try:
+            # The first run is what the first user pays; the warm runs are what users see afterwards
+            result['cold_ms'] = time_call(function)
+            result['warm_ms'] = max(time_call(function) for _ in range(args.repeats))
+        except Exception:
+            result['error'] = traceback.format_exc(limit=3)
+        result['passed'] = (
+            result['error'] is None
+            and result['cold_ms'] <= args.cold_budget_ms
+            and result['warm_ms'] <= args.budget_ms
+        )
+        results.append(result)
+
+        if result['error']:
+            print(f"❌ {name}: failed\n{result['error']}")
+        else:
+            status = '✅' if result['passed'] else '❌'
+            print(f"{status} {name:<40} cold {result['cold_ms']:8.1f} ms   warm {result['warm_ms']:8.1f} ms")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'budget_ms': args.budget_ms, 'cold_budget_ms': args.cold_budget_ms, 'repeats': args.repeats, 'results': results}, file, indent=2)
+        print(f"\n💾 Timings saved to {args.json}")
+
+    failed = [result['check'] for result in results if not result['passed']]
+    print("\n" + "=" * 50)
+    if failed:
+        print(f"❌ {len(failed)} of {len(results)} checks failed: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"✅ All {len(results)} checks passed!")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()